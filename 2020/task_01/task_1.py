@@ -1,29 +1,89 @@
-import itertools
-from typing import List, Iterable, Tuple
+from typing import List, Iterable, Iterator, Optional, Sequence, Tuple
 from functools import reduce
 
+from aoc import loader
 
-def _load_input_data() -> List[int]:
-    with open('puzzle.txt') as fp:
-        return [int(x) for x in fp.readlines()]
 
+def _load_input_data(filename: str) -> List[int]:
+    return list(loader.iter_ints(filename))
 
-def _get_combinations(numbers: List[int], length: int) -> Iterable[Tuple[int]]:
-    count_of_numbers = len(numbers)
-    for indexes in itertools.combinations(range(count_of_numbers), length):
-        yield tuple(numbers[index] for index in indexes)
 
+def _iter_pairs_with_summa(numbers: Iterable[int], summa: int) -> Iterator[Tuple[int, ...]]:
+    seen = set()
+    found = set()
+    for number in numbers:
+        pair = min(number, summa - number), max(number, summa - number)
+        if summa - number in seen and pair not in found:
+            found.add(pair)
+            yield pair
+        seen.add(number)
 
-def _find_combination_with_summa(numbers: List[int], length: int, summa: int) -> Tuple[int]:
-    return next(x for x in _get_combinations(numbers, length) if sum(x) == summa)
+
+def _iter_sorted_with_summa(numbers: Sequence[int], start: int, length: int,
+                            summa: int) -> Iterator[Tuple[int, ...]]:
+    if length == 2:
+        low, high = start, len(numbers) - 1
+        while low < high:
+            current = numbers[low] + numbers[high]
+            if current < summa:
+                low += 1
+            elif current > summa:
+                high -= 1
+            else:
+                yield numbers[low], numbers[high]
+                # equal values give the same combination again
+                while low < high and numbers[low] == numbers[low + 1]:
+                    low += 1
+                low += 1
+        return
+
+    for index in range(start, len(numbers) - length + 1):
+        number = numbers[index]
+        if index > start and number == numbers[index - 1]:
+            continue
+        if number * length > summa:
+            break
+        if number + numbers[-1] * (length - 1) < summa:
+            continue
+        for rest in _iter_sorted_with_summa(numbers, index + 1, length - 1, summa - number):
+            yield (number,) + rest
+
+
+def _iter_combinations_with_summa(numbers: List[int], length: int, summa: int) -> Iterator[Tuple[int, ...]]:
+    """ Distinct sorted combinations of values of different entries which sum up to the summa """
+    if length == 1:
+        return ((x,) for x in sorted(set(numbers)) if x == summa)
+    if length == 2:
+        return _iter_pairs_with_summa(numbers, summa)
+    return _iter_sorted_with_summa(sorted(numbers), 0, length, summa)
+
+
+def _find_combination_with_summa(numbers: List[int], length: int, summa: int) -> Optional[Tuple[int, ...]]:
+    return next(_iter_combinations_with_summa(numbers, length, summa), None)
 
 
 def _multiply(numbers: Iterable[int]) -> int:
     return reduce((lambda x, y: x * y), numbers)
 
 
+def _solve(filename: str, length: int, summa: int = 2020) -> int:
+    numbers = _load_input_data(filename)
+    combination = _find_combination_with_summa(numbers, length, summa)
+    if combination is None:
+        raise ValueError(f'no {length} entries sum up to {summa}')
+    return _multiply(combination)
+
+
+def solve_part1(filename: str) -> int:
+    return _solve(filename, 2)
+
+
+def solve_part2(filename: str) -> int:
+    return _solve(filename, 3)
+
+
 def _main():
-    numbers = _load_input_data()
+    numbers = _load_input_data('puzzle.txt')
 
     combination = _find_combination_with_summa(numbers, 2, 2020)
     print(combination, sum(combination), _multiply(combination))
@@ -31,6 +91,8 @@ def _main():
     combination = _find_combination_with_summa(numbers, 3, 2020)
     print(combination, sum(combination), _multiply(combination))
 
+    print('all triples', list(_iter_combinations_with_summa(numbers, 3, 2020)))
+
 
 if __name__ == '__main__':
     _main()
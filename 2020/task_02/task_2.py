@@ -1,58 +1,112 @@
-from typing import List, NamedTuple
-import re
-
-
-class _PasswordInfo(NamedTuple):
-    low: int
-    high: int
-    char: str
-    text: str
-
-
-def _load_input_data() -> List[_PasswordInfo]:
-    re_line_tpl = re.compile(r'(?P<low>\d+)-(?P<high>\d+) (?P<char>[a-z]): (?P<text>\w+)\n?')
-    with open('puzzle.txt') as fp:
-        lines = fp.readlines()
-    results = []
-    for line in lines:
-        match = re_line_tpl.fullmatch(line)
-        results.append(
-            _PasswordInfo(
-                low=int(match.group('low')),
-                high=int(match.group('high')),
-                char=match.group('char'),
-                text=match.group('text')
-            )
-        )
-    return results
-
-
-def _count_of_valid_by_old_policy(infos: List[_PasswordInfo]):
-    count = 0
-    for info in infos:
-        if info.low <= info.text.count(info.char) <= info.high:
-            count += 1
-    return count
-
-
-def _count_of_valid_by_new_policy(infos: List[_PasswordInfo]):
-    count = 0
-    for info in infos:
-        low = info.low - 1
-        high = info.high - 1
-        count_of_chars = len(info.text)
-        if low >= count_of_chars or high >= count_of_chars:
-            continue
-        if (info.text[low] == info.char) != (info.text[high] == info.char):
-            count += 1
-    return count
+import itertools
+from typing import Iterable, Iterator, NamedTuple, Tuple
 
+import numpy as np
 
-def _main():
-    infos = _load_input_data()
+_NEW_LINE = ord('\n')
+_BATCH_SIZE = 65536
+
+
+class _PasswordsTable(NamedTuple):
+    # passwords are the ranges [starts, ends) of the shared buffer
+    data: np.ndarray
+    lows: np.ndarray
+    highs: np.ndarray
+    chars: np.ndarray
+    starts: np.ndarray
+    ends: np.ndarray
+
+
+def _parse_numbers(data: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    numbers = np.zeros(len(starts), dtype=np.int64)
+    lengths = ends - starts
+    for offset in range(int(lengths.max(initial=0))):
+        has_digit = offset < lengths
+        numbers[has_digit] = numbers[has_digit] * 10 + data[starts[has_digit] + offset] - ord('0')
+    return numbers
+
+
+def _parse_table(data: np.ndarray) -> _PasswordsTable:
+    if data.size and data[-1] != _NEW_LINE:
+        data = np.append(data, np.uint8(_NEW_LINE))
+    # a batch is far below 2 GB, so int32 positions are enough
+    line_ends = np.flatnonzero(data == _NEW_LINE).astype(np.int32)
+    line_starts = np.concatenate(([0], line_ends[:-1] + 1)).astype(np.int32)
+    is_filled = line_ends > line_starts
+    line_starts, line_ends = line_starts[is_filled], line_ends[is_filled]
+
+    # every line is 'low-high char: password' with one dash and one colon
+    dashes = np.flatnonzero(data == ord('-')).astype(np.int32)
+    colons = np.flatnonzero(data == ord(':')).astype(np.int32)
+    if len(dashes) != len(line_starts) or len(colons) != len(line_starts):
+        raise ValueError('every line should look like "1-3 a: abcde"')
+
+    return _PasswordsTable(
+        data=data,
+        lows=_parse_numbers(data, line_starts, dashes),
+        highs=_parse_numbers(data, dashes + 1, colons - 2),
+        chars=data[colons - 1],
+        starts=colons + 2,
+        ends=line_ends - (data[line_ends - 1] == ord('\r'))
+    )
+
+
+def _iter_batches(lines: Iterable[bytes]) -> Iterator[_PasswordsTable]:
+    """ Tables of the fixed count of lines, every line ends with its new line """
+    lines = iter(lines)
+    while True:
+        batch = list(itertools.islice(lines, _BATCH_SIZE))
+        if not batch:
+            return
+        yield _parse_table(np.frombuffer(b''.join(batch), dtype=np.uint8))
+
+
+def _load_input_data(filename: str) -> Iterator[_PasswordsTable]:
+    # a buffered file keeps the memory bounded, the pages of a mapped one stay resident
+    with open(filename, 'rb') as fp:
+        yield from _iter_batches(fp)
 
-    print('count of valid by old policy', _count_of_valid_by_old_policy(infos))
-    print('count of valid by new policy', _count_of_valid_by_new_policy(infos))
+
+def _count_of_valid_by_old_policy(table: _PasswordsTable) -> int:
+    lengths = table.ends - table.starts
+    owners = np.repeat(np.arange(len(lengths), dtype=np.int32), lengths)
+    # positions of the chars of all passwords one after another
+    shifts = np.repeat(table.starts - np.cumsum(lengths, dtype=np.int32) + lengths, lengths)
+    positions = np.arange(len(owners), dtype=np.int32) + shifts
+    is_matched = table.data[positions] == table.chars[owners]
+    counts = np.bincount(owners[is_matched], minlength=len(lengths))
+    return int(np.count_nonzero((table.lows <= counts) & (counts <= table.highs)))
+
+
+def _count_of_valid_by_new_policy(table: _PasswordsTable) -> int:
+    first = table.starts + table.lows - 1
+    second = table.starts + table.highs - 1
+    is_fit = (first < table.ends) & (second < table.ends)
+    last = max(len(table.data) - 1, 0)
+    is_first = table.data[np.minimum(first, last)] == table.chars
+    is_second = table.data[np.minimum(second, last)] == table.chars
+    return int(np.count_nonzero(is_fit & (is_first != is_second)))
+
+
+def solve_part1(filename: str) -> int:
+    return sum(map(_count_of_valid_by_old_policy, _load_input_data(filename)))
+
+
+def solve_part2(filename: str) -> int:
+    return sum(map(_count_of_valid_by_new_policy, _load_input_data(filename)))
+
+
+def solve_stream(lines: Iterable[str]) -> Tuple[int, int]:
+    count_by_old_policy = count_by_new_policy = 0
+    for table in _iter_batches(f'{line}\n'.encode() for line in lines):
+        count_by_old_policy += _count_of_valid_by_old_policy(table)
+        count_by_new_policy += _count_of_valid_by_new_policy(table)
+    return count_by_old_policy, count_by_new_policy
+
+
+def _main():
+    print('count of valid by old policy', solve_part1('puzzle.txt'))
+    print('count of valid by new policy', solve_part2('puzzle.txt'))
 
 
 if __name__ == '__main__':
@@ -1,51 +1,71 @@
-class _RowInfo:
-    def __init__(self, line: str):
-        self._line = line
+import itertools
+import math
+from typing import Iterator, List, Sequence, Tuple
 
-    def get_item(self, col):
-        return self._line[col % len(self._line)]
+_TO_BITS = bytes.maketrans(b'#.', b'10')
+_CHUNK_SIZE = 1024 * 1024
 
 
-class _MapInfo:
-    def __init__(self, lines):
-        self._rows = [_RowInfo(x) for x in lines]
+class _SlopeCounter:
+    """ Trees met on one slope, fed with chunks of consecutive rows """
 
-    def count_or_rows(self):
-        return len(self._rows)
+    def __init__(self, right: int, down: int, width: int):
+        # the first column is the highest bit of a row, columns repeat after the period
+        period = width // math.gcd(right, width)
+        self._masks = [1 << (width - 1 - index * right % width) for index in range(period)]
+        self._down = down
+        self._count_of_steps = 0
+        self.count = 0
 
-    def get_item(self, row: int, col: int):
-        return self._rows[row].get_item(col)
+    def add_rows(self, rows: List[int], first_row_no: int):
+        rows_on_slope = rows[-first_row_no % self._down::self._down]
+        phase = self._count_of_steps % len(self._masks)
+        masks = itertools.cycle(self._masks[phase:] + self._masks[:phase])
+        self.count += sum(1 for row, mask in zip(rows_on_slope, masks) if row & mask)
+        self._count_of_steps += len(rows_on_slope)
 
 
-def _load_input_data(filename) -> _MapInfo:
-    with open(filename) as fp:
-        lines = fp.read().splitlines()
-        return _MapInfo(lines)
+def _iter_rows_chunks(filename: str) -> Iterator[Tuple[int, List[int]]]:
+    with open(filename, 'rb') as fp:
+        for lines in iter(lambda: fp.readlines(_CHUNK_SIZE), []):
+            chunk = b''.join(lines).translate(_TO_BITS).split()
+            if chunk:
+                # trees of a row are bits of an integer
+                yield len(chunk[0]), [int(x, 2) for x in chunk]
 
 
-def _count_of_trees(map_info: _MapInfo, down: int, right: int):
-    row = 0
-    col = 0
-    count = 0
+def _count_of_trees_by_slopes(filename: str, slopes: Sequence[Tuple[int, int]]) -> List[int]:
+    counters = []
+    row_no = 0
+    for width, rows in _iter_rows_chunks(filename):
+        if not counters:
+            counters = [_SlopeCounter(right, down, width) for right, down in slopes]
+        for counter in counters:
+            counter.add_rows(rows, row_no)
+        row_no += len(rows)
+    return [counter.count for counter in counters] if counters else [0] * len(slopes)
 
-    while row < map_info.count_or_rows():
-        item = map_info.get_item(row, col)
-        if item == '#':
-            count += 1
-        row += down
-        col += right
 
-    return count
+_SLOPES = ((1, 1), (3, 1), (5, 1), (7, 1), (1, 2))
+
+
+def solve_part1(filename: str) -> int:
+    return _count_of_trees_by_slopes(filename, [(3, 1)])[0]
+
+
+def solve_part2(filename: str) -> int:
+    answer = 1
+    for count in _count_of_trees_by_slopes(filename, _SLOPES):
+        answer *= count
+    return answer
 
 
 def _main():
     for filename in ('test.txt', 'puzzle.txt'):
-        map_info = _load_input_data(filename)
         answer = 1
 
         print('\n', filename)
-        for right, down in ((1, 1), (3, 1), (5, 1), (7, 1), (1, 2)):
-            count = _count_of_trees(map_info, down, right)
+        for (right, down), count in zip(_SLOPES, _count_of_trees_by_slopes(filename, _SLOPES)):
             answer *= count
             print('right', right, 'down', down, 'count of trees', count)
         print('answer', answer)
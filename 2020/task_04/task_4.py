@@ -1,88 +1,88 @@
 import re
-from typing import List, Dict, Optional
+from collections import Counter
+from typing import Callable, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
 
-_RE_DELIMITER = re.compile(r'\s+')
-_RE_HGT_TMPL = re.compile(r'(?P<height>\d{2,3})(?P<units>\w{2})')
-_RE_HCL_TMPL = re.compile(r'#[0-9a-f]{6}')
-_RE_PID_TMPL = re.compile(r'\d{9}')
+from aoc import loader
 
-_MANDATORY_FIELDS = ('byr', 'iyr', 'eyr', 'hgt', 'hcl', 'ecl', 'pid')
-_HEIGHT_RANGES = {'cm': (150, 193), 'in': (59, 76)}
 
+class _FieldRule(NamedTuple):
+    pattern: str
+    # allowed ranges of the number in the first group, by the units in the second one
+    ranges: Optional[Dict[str, Tuple[int, int]]] = None
 
-class _PassportInfo:
-    def __init__(self, text: str):
-        self.fields = {}  # type: Dict[str, str]
-        for field_info in _RE_DELIMITER.split(text):
-            name, value = field_info.split(':')
-            self.fields[name] = value
 
-    @staticmethod
-    def _is_value_in_range(value: Optional[str], low: int, high: int) -> bool:
-        return value and value.isdigit() and (low <= int(value) <= high)
+_SCHEMA = {
+    'byr': _FieldRule(r'(\d+)', {'': (1920, 2002)}),
+    'iyr': _FieldRule(r'(\d+)', {'': (2010, 2020)}),
+    'eyr': _FieldRule(r'(\d+)', {'': (2020, 2030)}),
+    'hgt': _FieldRule(r'(\d{2,3})(cm|in)', {'cm': (150, 193), 'in': (59, 76)}),
+    'hcl': _FieldRule(r'#[0-9a-f]{6}'),
+    'ecl': _FieldRule(r'amb|blu|brn|gry|grn|hzl|oth'),
+    'pid': _FieldRule(r'\d{9}'),
+}  # type: Dict[str, _FieldRule]
 
-    def _get_value(self, name: str) -> Optional[str]:
-        return self.fields.get(name)
+# a validator returns the first failed field, or None for a valid passport
+TValidator = Callable[[Dict[str, str]], Optional[str]]
 
-    def _is_field_in_range(self, name: str, low: int, high: int) -> bool:
-        return self._is_value_in_range(self._get_value(name), low, high)
 
-    def _is_field_match_pattern(self, name: str, pattern: re.Pattern):
-        value = self._get_value(name)
-        return value and pattern.fullmatch(value)
+def _compile_rule(rule: _FieldRule) -> Callable[[str], bool]:
+    regex = re.compile(rule.pattern)
+    if not rule.ranges:
+        return lambda value: regex.fullmatch(value) is not None
 
-    def is_byr_valid(self):
-        return self._is_field_in_range('byr', 1920, 2002)
+    def check(value: str) -> bool:
+        match = regex.fullmatch(value)
+        if not match:
+            return False
+        number, *units = match.groups()
+        low, high = rule.ranges[units[0] if units else '']
+        return low <= int(number) <= high
 
-    def is_iyr_valid(self):
-        return self._is_field_in_range('iyr', 2010, 2020)
+    return check
 
-    def is_eyr_valid(self):
-        return self._is_field_in_range('eyr', 2020, 2030)
 
-    def is_hgt_valid(self):
-        value = self._get_value('hgt')
-        if not value:
-            return False
+def _compile_schema(schema: Dict[str, _FieldRule], check_values: bool) -> TValidator:
+    checks = [(name, _compile_rule(rule) if check_values else None) for name, rule in schema.items()]
 
-        match = _RE_HGT_TMPL.fullmatch(value)
-        if not match:
-            return False
+    def validate(fields: Dict[str, str]) -> Optional[str]:
+        for name, check in checks:
+            value = fields.get(name)
+            if value is None or (check and not check(value)):
+                return name
+        return None
+
+    return validate
+
+
+_HAS_MANDATORY_FIELDS = _compile_schema(_SCHEMA, check_values=False)
+_IS_VALID = _compile_schema(_SCHEMA, check_values=True)
 
-        units = match.group('units')
-        if units not in _HEIGHT_RANGES:
-            return False
 
-        height = match.group('height')
-        low, high = _HEIGHT_RANGES.get(units)
-        return self._is_value_in_range(height, low, high)
+def _load_input_data(filename) -> Iterator[Dict[str, str]]:
+    for lines in loader.iter_blocks(filename):
+        yield dict(field.split(':', 1) for line in lines for field in line.split())
 
-    def is_hcl_valid(self):
-        return self._is_field_match_pattern('hcl', _RE_HCL_TMPL)
 
-    def is_ecl_valid(self):
-        return self._get_value('ecl') in ('amb', 'blu', 'brn', 'gry', 'grn', 'hzl', 'oth')
+def _count_failures(passports: Iterable[Dict[str, str]], validator: TValidator) -> Counter:
+    """ Count of passports by the first failed field, valid ones are counted by None """
+    return Counter(map(validator, passports))
 
-    def is_pid_valid(self):
-        return self._is_field_match_pattern('pid', _RE_PID_TMPL)
 
-    def is_valid(self):
-        return (self.is_byr_valid() and self.is_iyr_valid() and self.is_eyr_valid() and self.is_hgt_valid() and
-                self.is_hcl_valid() and self.is_ecl_valid() and self.is_pid_valid())
+def solve_part1(filename: str) -> int:
+    return _count_failures(_load_input_data(filename), _HAS_MANDATORY_FIELDS)[None]
 
 
-def _load_input_data(filename) -> List[_PassportInfo]:
-    with open(filename) as fp:
-        texts = fp.read().split('\n\n')
-        return [_PassportInfo(text) for text in texts]
+def solve_part2(filename: str) -> int:
+    return _count_failures(_load_input_data(filename), _IS_VALID)[None]
 
 
 def _main():
     for filename in ('test.txt', 'puzzle.txt'):
         print('\n', filename)
-        passports = _load_input_data(filename)
-        valid = list(filter(_PassportInfo.is_valid, passports))
-        print('count of valid', len(valid))
+        failures = _count_failures(_load_input_data(filename), _IS_VALID)
+        print('count of valid', failures.pop(None, 0))
+        for name in _SCHEMA:
+            print('failed on', name, failures[name])
 
 
 if __name__ == '__main__':
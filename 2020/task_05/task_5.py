@@ -1,46 +1,85 @@
-from typing import Dict
+import functools
+import itertools
+import operator
+from typing import Iterable, Iterator, List, Optional, Tuple
 
+# a boarding pass is the binary code of the seat ID: row * 8 + col
+_TO_BITS = bytes.maketrans(b'FBLR', b'0101')
+_CHUNK_SIZE = 1024 * 1024
 
-class _SeatInfo:
-    def __init__(self, ticket: str):
-        self._data = ticket
 
-    def get_row(self) -> int:
-        value = self._data[:7].replace('B', '1').replace('F', '0')
-        return int(value, 2)
+def _decode(tickets: bytes) -> List[int]:
+    return [int(x, 2) for x in tickets.translate(_TO_BITS).split()]
 
-    def get_col(self) -> int:
-        value = self._data[7:].replace('R', '1').replace('L', '0')
-        return int(value, 2)
 
-    def get_seat_id(self) -> int:
-        return self.get_row() * 8 + self.get_col()
+def _xor_up_to(number: int) -> int:
+    """ 0 ^ 1 ^ ... ^ number """
+    return (number, 1, number + 1, 0)[number % 4]
 
 
-def _load_input_data(filename) -> Dict[int, _SeatInfo]:
-    with open(filename) as fp:
-        tickets = fp.read().splitlines()
-    seats_infos = {}
-    for ticket in tickets:
-        seat_info = _SeatInfo(ticket)
-        seats_infos[seat_info.get_seat_id()] = seat_info
-    return seats_infos
+class _SeatsSummary:
+    """ Count, bounds and xor of the taken seat IDs, enough to find the only free seat """
 
+    def __init__(self):
+        self.count = 0
+        self.low = None  # type: Optional[int]
+        self.high = None  # type: Optional[int]
+        self._xor = 0
 
-def _main():
-    for filename in ('test.txt', 'puzzle.txt'):
-        print('\n', filename)
-        seats_by_ids = _load_input_data(filename)
+    def update(self, seat_ids: List[int]):
+        if not seat_ids:
+            return
+        self.count += len(seat_ids)
+        self.low = min(seat_ids) if self.low is None else min(self.low, min(seat_ids))
+        self.high = max(seat_ids) if self.high is None else max(self.high, max(seat_ids))
+        self._xor ^= functools.reduce(operator.xor, seat_ids)
+
+    def get_free_seat(self) -> Optional[int]:
+        # taken seats are unique, so exactly one is free when the count is one less than the span
+        if self.low is None or self.count != self.high - self.low:
+            return None
+        return _xor_up_to(self.high) ^ _xor_up_to(self.low - 1) ^ self._xor
+
+
+def _load_input_data(filename) -> _SeatsSummary:
+    summary = _SeatsSummary()
+    with open(filename, 'rb') as fp:
+        for lines in iter(lambda: fp.readlines(_CHUNK_SIZE), []):
+            summary.update(_decode(b''.join(lines)))
+    return summary
+
+
+def solve_part1(filename: str) -> int:
+    return _load_input_data(filename).high
 
-        min_seat_id = min(seats_by_ids.keys())
-        print('min seat ID', min_seat_id)
 
-        max_seat_id = max(seats_by_ids.keys())
-        print('max seat ID', max_seat_id)
+def solve_part2(filename: str) -> Optional[int]:
+    return _load_input_data(filename).get_free_seat()
 
-        for seat_id in range(min_seat_id, max_seat_id):
-            if seat_id not in seats_by_ids and (seat_id - 1) in seats_by_ids and (seat_id + 1) in seats_by_ids:
-                print('possible seat id', seat_id)
+
+def _iter_batches(lines: Iterable[str]) -> Iterator[bytes]:
+    lines = iter(lines)
+    while True:
+        batch = list(itertools.islice(lines, _CHUNK_SIZE // 16))
+        if not batch:
+            return
+        yield ' '.join(batch).encode()
+
+
+def solve_stream(lines: Iterable[str]) -> Tuple[int, Optional[int]]:
+    summary = _SeatsSummary()
+    for tickets in _iter_batches(lines):
+        summary.update(_decode(tickets))
+    return summary.high, summary.get_free_seat()
+
+
+def _main():
+    for filename in ('test.txt', 'puzzle.txt'):
+        print('\n', filename)
+        summary = _load_input_data(filename)
+        print('min seat ID', summary.low)
+        print('max seat ID', summary.high)
+        print('free seat id', summary.get_free_seat())
 
 
 if __name__ == '__main__':
@@ -1,33 +1,47 @@
-import string
-from typing import List
+import functools
+import operator
+from typing import Iterator, List
+
+from aoc import loader
+
+# answers of a person are bits of a 26-bit integer, 'a' is the lowest one
+_BIT_by_CODE = [1 << (code - ord('a')) if ord('a') <= code <= ord('z') else 0 for code in range(256)]
+_ALL_ANSWERS = (1 << 26) - 1
+
+
+def _encode(answers: bytes) -> int:
+    return functools.reduce(operator.or_, map(_BIT_by_CODE.__getitem__, answers), 0)
 
 
 class _GroupInfo:
-    def __init__(self, group_answers: str):
-        self.by_persons = [set(answers) for answers in group_answers.splitlines()]
+    def __init__(self, group_answers: List[bytes]):
+        masks = list(map(_encode, group_answers))
+        self._any_yes = functools.reduce(operator.or_, masks, 0)
+        self._all_yes = functools.reduce(operator.and_, masks, _ALL_ANSWERS)
+
+    def count_of_any_yes(self) -> int:
+        return self._any_yes.bit_count()
+
+    def count_of_all_yes(self) -> int:
+        return self._all_yes.bit_count()
+
+
+def _load_input_data(filename) -> Iterator[_GroupInfo]:
+    return map(_GroupInfo, loader.group_blocks(loader.iter_byte_lines(filename)))
 
-    def count_of_any_yes(self):
-        results = set()
-        for answers in self.by_persons:
-            results |= answers
-        return len(results)
 
-    def count_of_all_yes(self):
-        results = set(string.ascii_lowercase)
-        for answers in self.by_persons:
-            results &= answers
-        return len(results)
+def solve_part1(filename: str) -> int:
+    return sum(x.count_of_any_yes() for x in _load_input_data(filename))
 
 
-def _load_input_data(filename) -> List[_GroupInfo]:
-    with open(filename) as fp:
-        return [_GroupInfo(answers) for answers in fp.read().split('\n\n')]
+def solve_part2(filename: str) -> int:
+    return sum(x.count_of_all_yes() for x in _load_input_data(filename))
 
 
 def _main():
     for filename in ('test.txt', 'puzzle.txt'):
         print('\n', filename)
-        groups_infos = _load_input_data(filename)
+        groups_infos = list(_load_input_data(filename))
         print('count of any yes', sum(x.count_of_any_yes() for x in groups_infos))
         print('count of all yes', sum(x.count_of_all_yes() for x in groups_infos))
 
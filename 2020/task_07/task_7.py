@@ -1,15 +1,31 @@
 import re
-from collections import defaultdict
-from typing import Dict, List, Tuple
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from aoc import loader
 
 _RE_RULE_DEF_TMPL = re.compile(r'(?P<color>.*) bags contain (?P<content>.*)')
 _RE_INNER_BAGS_COLORS = re.compile(r'(?P<count>\d+) (?P<color>[a-z ]+) bag')
 
 
-class _RulesInfo:
+class _BagsGraph:
+    """ Colors are integer IDs, edges go both from outer to inner bags and back """
+
     def __init__(self):
-        self.outer_bags = defaultdict(list)  # type: Dict[str, List[str]]
-        self.inner_bags = defaultdict(list)  # type: Dict[str, List[Tuple[int, str]]]
+        self.colors = []  # type: List[str]
+        self._ids_by_colors = {}  # type: Dict[str, int]
+        self._outer_bags = []  # type: List[List[int]]
+        self._inner_bags = []  # type: List[List[Tuple[int, int]]]
+        self._totals = None  # type: Optional[List[Optional[int]]]
+
+    def _get_id(self, color: str) -> int:
+        color_id = self._ids_by_colors.get(color)
+        if color_id is None:
+            color_id = self._ids_by_colors[color] = len(self.colors)
+            self.colors.append(color)
+            self._outer_bags.append([])
+            self._inner_bags.append([])
+        return color_id
 
     @staticmethod
     def _parse_rule_def(text: str) -> Tuple[str, str]:
@@ -18,50 +34,106 @@ class _RulesInfo:
 
     def add_rule(self, text: str):
         outer_color, content_info = self._parse_rule_def(text)
-        inner_colors = _RE_INNER_BAGS_COLORS.findall(content_info)
-        for count_of_bags, inner_color in inner_colors:
-            self.outer_bags[inner_color].append(outer_color)
-            self.inner_bags[outer_color].append((int(count_of_bags), inner_color))
-
-    def possible_outer_bags(self, breadcrumbs: List[str]) -> List[List[str]]:
-        variants = []
-        for holder_color in self.outer_bags.get(breadcrumbs[0], []):
-            if holder_color in breadcrumbs:
-                print('found cycle', breadcrumbs, holder_color)
-            variant = [holder_color, *breadcrumbs]
-            variants.append(variant)
-            variants.extend(self.possible_outer_bags(variant))
-        return variants
+        outer_id = self._get_id(outer_color)
+        for count_of_bags, inner_color in _RE_INNER_BAGS_COLORS.findall(content_info):
+            inner_id = self._get_id(inner_color)
+            self._outer_bags[inner_id].append(outer_id)
+            self._inner_bags[outer_id].append((int(count_of_bags), inner_id))
+        self._totals = None
+
+    def count_of_outer_bags(self, color: str) -> int:
+        if color not in self._ids_by_colors:
+            return 0
+        start = self._ids_by_colors[color]
+        visited = bytearray(len(self.colors))
+        visited[start] = True
+        queue = deque([start])
+        while queue:
+            for holder_id in self._outer_bags[queue.popleft()]:
+                if not visited[holder_id]:
+                    visited[holder_id] = True
+                    queue.append(holder_id)
+        return sum(visited) - 1
+
+    def find_cycle(self, color: Optional[str] = None) -> Optional[List[str]]:
+        """ Colors of bags which contain each other, inside the given color if any, the first one is repeated """
+        states = bytearray(len(self.colors))  # 0 - not visited, 1 - on the path, 2 - done
+        roots = range(len(self.colors)) if color is None else [self._ids_by_colors[color]]
+        for root in roots:
+            if states[root]:
+                continue
+            path = [root]
+            iterators = [iter(self._inner_bags[root])]
+            states[root] = 1
+            while iterators:
+                step = next(iterators[-1], None)
+                if step is None:
+                    states[path.pop()] = 2
+                    iterators.pop()
+                    continue
+                inner_id = step[1]
+                if states[inner_id] == 1:
+                    cycle = path[path.index(inner_id):] + [inner_id]
+                    return [self.colors[x] for x in cycle]
+                if not states[inner_id]:
+                    states[inner_id] = 1
+                    path.append(inner_id)
+                    iterators.append(iter(self._inner_bags[inner_id]))
+        return None
+
+    def _count_totals(self) -> List[Optional[int]]:
+        # inner bags are counted before the outer ones, in the order of Kahn's algorithm,
+        # the bags which contain a cycle are never reached and stay unresolved
+        totals = [None] * len(self.colors)  # type: List[Optional[int]]
+        pending = [len(x) for x in self._inner_bags]
+        queue = deque(color_id for color_id, count in enumerate(pending) if not count)
+        for color_id in queue:
+            totals[color_id] = 0
+        while queue:
+            inner_id = queue.popleft()
+            for outer_id in self._outer_bags[inner_id]:
+                pending[outer_id] -= 1
+                if not pending[outer_id]:
+                    totals[outer_id] = sum(
+                        (totals[x] + 1) * count_of_bags for count_of_bags, x in self._inner_bags[outer_id]
+                    )
+                    queue.append(outer_id)
+        return totals
 
     def count_of_inner_bags(self, color: str) -> int:
-        count = 0
-        for count_of_bags, inner_color in self.inner_bags[color]:
-            count += (self.count_of_inner_bags(inner_color) + 1) * count_of_bags
-        return count
+        if color not in self._ids_by_colors:
+            return 0
+        if self._totals is None:
+            self._totals = self._count_totals()
+        total = self._totals[self._ids_by_colors[color]]
+        if total is None:
+            raise ValueError(f'bags contain each other: {" -> ".join(self.find_cycle(color))}')
+        return total
 
 
-def _load_input_data(filename) -> _RulesInfo:
-    with open(filename) as fp:
-        data = fp.read()
-    rules_info = _RulesInfo()
-    for line in data.splitlines():
-        rules_info.add_rule(line)
-    return rules_info
+def _load_input_data(filename) -> _BagsGraph:
+    bags_graph = _BagsGraph()
+    for line in loader.iter_lines(filename):
+        if line:
+            bags_graph.add_rule(line)
+    return bags_graph
 
 
-def _main():
-    for filename in ('test_0.txt', 'test_1.txt', 'puzzle.txt'):
-        print('\n', filename)
-        rules_info = _load_input_data(filename)
+def solve_part1(filename: str) -> int:
+    return _load_input_data(filename).count_of_outer_bags('shiny gold')
 
-        variants = rules_info.possible_outer_bags(['shiny gold'])
-        print('found', len(variants), 'variants')
 
-        top_bag_colors = set(bag_colors[0] for bag_colors in variants)
-        print('answer is', len(top_bag_colors))
+def solve_part2(filename: str) -> int:
+    return _load_input_data(filename).count_of_inner_bags('shiny gold')
 
-        count_of_inner_bags = rules_info.count_of_inner_bags('shiny gold')
-        print('count of inner bags', count_of_inner_bags)
+
+def _main():
+    for filename in ('test_0.txt', 'test_1.txt', 'puzzle.txt'):
+        print('\n', filename)
+        bags_graph = _load_input_data(filename)
+        print('found cycle', bags_graph.find_cycle())
+        print('answer is', bags_graph.count_of_outer_bags('shiny gold'))
+        print('count of inner bags', bags_graph.count_of_inner_bags('shiny gold'))
 
 
 if __name__ == '__main__':
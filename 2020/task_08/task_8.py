@@ -1,73 +1,87 @@
-from typing import List
-
-
-class _CommandInfo:
-    def __init__(self, name: str, arg: str):
-        self.name = name
-        self.arg = int(arg)
+from collections import deque
+from typing import Optional
+
+from aoc import bootcode, loader
+
+
+def _find_terminating(program: bootcode.Program) -> bytearray:
+    """ Addresses from which the program terminates, found backward from the end """
+    count_of_commands = len(program.opcodes)
+    # every address past the last command is the end
+    previous = [[] for _ in range(count_of_commands + 1)]
+    for index in range(count_of_commands):
+        next_index = program.get_next(index)
+        if next_index >= 0:
+            previous[min(next_index, count_of_commands)].append(index)
+
+    terminating = bytearray(count_of_commands + 1)
+    terminating[count_of_commands] = True
+    queue = deque([count_of_commands])
+    while queue:
+        for index in previous[queue.popleft()]:
+            if not terminating[index]:
+                terminating[index] = True
+                queue.append(index)
+    return terminating
+
+
+def _is_terminating_at(terminating: bytearray, index: int) -> bool:
+    return index >= len(terminating) - 1 or (index >= 0 and terminating[index])
+
+
+def execute(program: bootcode.Program) -> int:
+    machine = bootcode.Machine(program)
+    machine.run()
+    return machine.accumulator
+
+
+def fix_and_execute(program: bootcode.Program) -> Optional[int]:
+    """ Swaps the first jmp or nop on the way which leads to the end, then runs the rest """
+    terminating = _find_terminating(program)
+    visited = bytearray(len(program.opcodes))
+    index = 0
+    accumulator = 0
+
+    while 0 <= index < len(program.opcodes) and not visited[index]:
+        visited[index] = True
+        if program.opcodes[index] == bootcode.ACC:
+            accumulator += program.args[index]
+        else:
+            swapped_next = program.get_next(index, is_swapped=True)
+            if _is_terminating_at(terminating, swapped_next):
+                machine = bootcode.Machine(program, accumulator=accumulator, index=swapped_next)
+                machine.run()
+                return machine.accumulator
+        index = program.get_next(index)
 
-    def swap_jmp_and_nop(self):
-        self.name = {'nop': 'jmp', 'jmp': 'nop'}[self.name]
+    # the program is not corrupted when it reaches the end without swaps
+    return accumulator if index >= len(program.opcodes) else None
 
 
-class _ContextInfo:
-    def __init__(self):
-        self.commands = []  # type: List[_CommandInfo]
+def _load_input_data(filename) -> bootcode.Program:
+    return bootcode.Program.from_lines(loader.iter_lines(filename))
 
-    def add_command(self, text: str):
-        name, arg = text.split(' ')
-        self.commands.append(_CommandInfo(name, arg))
 
-    def _try_execute(self):
-        accumulator = 0
-        index = 0
-        visited = []
+def solve_part1(filename: str) -> int:
+    return execute(_load_input_data(filename))
 
-        while index < len(self.commands) and index not in visited:
-            command = self.commands[index]
-            visited.append(index)
-            if command.name == 'nop':
-                index += 1
-            elif command.name == 'acc':
-                accumulator += command.arg
-                index += 1
-            elif command.name == 'jmp':
-                index += command.arg
 
-        is_executed = index >= len(self.commands)
-        if is_executed:
-            print('executed successfully, accumulator is', accumulator)
-        else:
-            print('found cycle, accumulator is', accumulator)
-        return is_executed
-
-    def fix_and_execute(self):
-        index = 0
-        is_executed = False
-        while not is_executed and index < len(self.commands):
-            command = self.commands[index]
-            if command.name != 'acc':
-                command.swap_jmp_and_nop()
-                print('changed command at', index + 1)
-                is_executed = self._try_execute()
-                command.swap_jmp_and_nop()
-            index += 1
-
-
-def _load_input_data(filename) -> _ContextInfo:
-    with open(filename) as fp:
-        data = fp.read()
-    context = _ContextInfo()
-    for line in data.splitlines():
-        context.add_command(line)
-    return context
+def solve_part2(filename: str) -> Optional[int]:
+    return fix_and_execute(_load_input_data(filename))
 
 
 def _main():
     for filename in ('test.txt', 'puzzle.txt'):
         print('\n', filename)
-        context = _load_input_data(filename)
-        context.fix_and_execute()
+        program = _load_input_data(filename)
+        hit_counter = bootcode.HitCounter(program)
+        machine = bootcode.Machine(program, hooks=[hit_counter])
+        machine.run()
+        print('found cycle of', len(machine.get_loop()), 'commands, accumulator is', machine.accumulator)
+        machine.run(stop_on_loop=False, max_steps=1000)
+        for loop in hit_counter.get_hot_loops(top=3):
+            print(f'loop {loop.start}..{loop.end} taken {loop.count_of_turns} times')
+        print('executed successfully, accumulator is', fix_and_execute(program))
 
 
 if __name__ == '__main__':
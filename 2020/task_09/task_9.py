@@ -1,63 +1,114 @@
-import itertools
+import os
+from collections import Counter, deque
+from typing import Deque, Iterable, Iterator, List, Optional, Tuple
 
-from typing import List, Tuple, Iterable
+from aoc import loader
 
 
 def _load_input_data(filename) -> List[int]:
-    with open(filename) as fp:
-        data = fp.read()
-    return [int(x) for x in data.splitlines()]
+    return list(loader.iter_ints(filename))
 
 
-def _get_pairs_of_indexes(length: int) -> Iterable[Tuple[int]]:
-    for index_0, index_1 in itertools.combinations(range(length), 2):
-        yield index_0, index_1
+class _SumsWindow:
+    """ Multiset of the last numbers, a number is valid when it is a sum of two of them """
 
+    def __init__(self, length: int):
+        self.length = length
+        self._numbers = deque()  # type: Deque[int]
+        self._counts = Counter()  # type: Counter
 
-def _is_a_sum_of_any(value: int, numbers: List[int]):
-    for index_0, index_1 in _get_pairs_of_indexes(len(numbers)):
-        if value == (numbers[index_0] + numbers[index_1]):
-            return True
-    return False
+    @property
+    def is_full(self) -> bool:
+        return len(self._numbers) == self.length
 
+    def push(self, value: int):
+        if self.is_full:
+            dropped = self._numbers.popleft()
+            self._counts[dropped] -= 1
+            if not self._counts[dropped]:
+                del self._counts[dropped]
+        self._numbers.append(value)
+        self._counts[value] += 1
 
-def _found_not_a_sum_of_previous(numbers: List[int], length: int):
-    for index in range(length, len(numbers)):
-        value = numbers[index]
-        if not _is_a_sum_of_any(value, numbers[index - length:index]):
-            return value
+    def is_a_sum_of_any(self, value: int) -> bool:
+        counts = self._counts
+        for number in counts:
+            other = value - number
+            if other in counts and (other != number or counts[number] > 1):
+                return True
+        return False
 
 
-def _found_sequence_with_sum(numbers: List[int], summa: int):
-    founded = None
-    low_ind = 0
-    high_ind = 0
+def _iter_not_sums_of_previous(numbers: Iterable[int], length: int) -> Iterator[int]:
+    window = _SumsWindow(length)
+    for value in numbers:
+        if window.is_full and not window.is_a_sum_of_any(value):
+            yield value
+        window.push(value)
 
-    while not founded and low_ind < (len(numbers) - 1):
-        current = numbers[low_ind]
-        if current < summa:
-            high_ind = low_ind + 1
-            while current < summa and high_ind < len(numbers):
-                current += numbers[high_ind]
-                high_ind += 1
-            if current == summa:
-                founded = numbers[low_ind:high_ind]
-        low_ind += 1
-        
-    print('found sequence with sum', low_ind, high_ind, founded)
-    return min(founded) + max(founded)
+
+def _found_not_a_sum_of_previous(numbers: Iterable[int], length: int) -> Optional[int]:
+    return next(_iter_not_sums_of_previous(numbers, length), None)
+
+
+def _found_sequence_with_sum(numbers: Iterable[int], summa: int) -> Optional[List[int]]:
+    """ The first range of at least two positive numbers with the sum, by two pointers """
+    sequence = deque()  # type: Deque[int]
+    current = 0
+    for value in numbers:
+        sequence.append(value)
+        current += value
+        while current > summa or (current == summa and len(sequence) < 2):
+            current -= sequence.popleft()
+        if current == summa and len(sequence) > 1:
+            return list(sequence)
+    return None
+
+
+def _get_weakness(sequence: Optional[List[int]]) -> Optional[int]:
+    return min(sequence) + max(sequence) if sequence else None
+
+
+_PREAMBLE_LENGTHS = {'test.txt': 5, 'puzzle.txt': 25}
+_DEFAULT_PREAMBLE_LENGTH = 25
+
+
+def _get_preamble_length(filename: str) -> int:
+    return _PREAMBLE_LENGTHS.get(os.path.basename(filename), _DEFAULT_PREAMBLE_LENGTH)
+
+
+def solve_part1(filename: str) -> Optional[int]:
+    return _found_not_a_sum_of_previous(loader.iter_ints(filename), _get_preamble_length(filename))
+
+
+def solve_part2(filename: str) -> Optional[int]:
+    numbers = _load_input_data(filename)
+    invalid = _found_not_a_sum_of_previous(numbers, _get_preamble_length(filename))
+    if invalid is None:
+        return None
+    return _get_weakness(_found_sequence_with_sum(numbers, invalid))
+
+
+def solve_stream(lines: Iterable[str]) -> Tuple[Optional[int], Optional[int]]:
+    # the range may be anywhere in the input, so the numbers are kept for the second pass
+    numbers = [int(line) for line in lines if line]
+    invalid = _found_not_a_sum_of_previous(numbers, _DEFAULT_PREAMBLE_LENGTH)
+    if invalid is None:
+        return None, None
+    return invalid, _get_weakness(_found_sequence_with_sum(numbers, invalid))
 
 
 def _main():
-    for filename, length in (('test.txt', 5), ('puzzle.txt', 25)):
+    for filename, length in _PREAMBLE_LENGTHS.items():
         print('\n', filename)
         numbers = _load_input_data(filename)
 
         invalid = _found_not_a_sum_of_previous(numbers, length)
         print('found not a sum of previous', length, invalid)
 
-        answer = _found_sequence_with_sum(numbers, invalid)
-        print('min + max in sequence', answer)
+        sequence = _found_sequence_with_sum(numbers, invalid)
+        print('found sequence with sum', sequence)
+        print('min + max in sequence', _get_weakness(sequence))
 
 
 if __name__ == '__main__':
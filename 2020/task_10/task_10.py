@@ -1,59 +1,62 @@
-from collections import defaultdict
-from typing import Tuple, List
+import itertools
+from collections import Counter, deque
+from typing import Deque, Iterable, List, NamedTuple, Optional, Tuple
+
+from aoc import loader
+
+
+class _ChainInfo(NamedTuple):
+    diffs: Counter
+    count_of_ways: int
 
 
 def _load_input_data(filename) -> List[int]:
-    with open(filename) as fp:
-        text = fp.read()
-    numbers = sorted(int(x) for x in text.splitlines())
-    numbers.insert(0, 0)
-    numbers.append(numbers[-1] + 3)
-    return numbers
+    return sorted(loader.iter_ints(filename))
 
 
-def _count_of_diffs(numbers: List[int]) -> Tuple[int, int]:
-    diffs_in_1 = 0
-    diffs_in_3 = 0
-    for index in range(1, len(numbers)):
-        diff = numbers[index] - numbers[index - 1]
-        if diff == 1:
-            diffs_in_1 += 1
-        elif diff == 3:
-            diffs_in_3 += 1
-    return diffs_in_1, diffs_in_3
+def _scan_chain(adapters: Iterable[int], max_step: int = 3, modulo: Optional[int] = None) -> _ChainInfo:
+    """ Diffs and ways to chain the outlet, the sorted adapters and the device in one pass """
+    # pairs of the joltage and the count of ways to reach it, only the ones in reach are kept
+    window = deque()  # type: Deque[Tuple[int, int]]
+    ways_in_window = 0
+    diffs = Counter()
+    previous = 0
+    ways = 1
 
+    for joltage in itertools.chain((0,), adapters, (None,)):
+        if joltage is None:
+            # the device is rated for the max step above the highest adapter
+            joltage = previous + max_step
+        if window:
+            diffs[joltage - previous] += 1
+            while window and joltage - window[0][0] > max_step:
+                ways_in_window -= window.popleft()[1]
+            ways = ways_in_window % modulo if modulo else ways_in_window
+        window.append((joltage, ways))
+        ways_in_window += ways
+        previous = joltage
 
-def _is_diff_in_range(numbers: List[int], previous: int, current: int) -> bool:
-    diff = numbers[current] - numbers[previous]
-    return diff <= 3
+    return _ChainInfo(diffs=diffs, count_of_ways=ways)
 
 
-def _count_of_variants(numbers: List[int]) -> int:
-    count_of_ways = defaultdict(lambda: 0)
-    count_of_ways[0] = 1
-    count_of_ways[1] = 1
+def solve_part1(filename: str) -> int:
+    diffs = _scan_chain(_load_input_data(filename)).diffs
+    return diffs[1] * diffs[3]
 
-    current = 2
-    while current < len(numbers):
-        previous = current - 1
-        while previous >= 0 and _is_diff_in_range(numbers, previous, current):
-            count_of_ways[current] += count_of_ways[previous]
-            previous -= 1
-        current += 1
 
-    return count_of_ways[current - 1]
+def solve_part2(filename: str) -> int:
+    return _scan_chain(_load_input_data(filename)).count_of_ways
 
 
 def _main():
     for filename in ('test_0.txt', 'test_1.txt', 'puzzle.txt'):
         print('\n', filename)
-        jolts = _load_input_data(filename)
+        chain_info = _scan_chain(_load_input_data(filename))
 
-        diffs_in_1, diffs_in_3 = _count_of_diffs(jolts)
+        diffs_in_1, diffs_in_3 = chain_info.diffs[1], chain_info.diffs[3]
         print('diffs in 1 is', diffs_in_1, 'diffs in 3 is', diffs_in_3, 'answer is', diffs_in_1 * diffs_in_3)
-
-        count_of_variants = _count_of_variants(jolts)
-        print('count of variants', count_of_variants)
+        print('count of variants', chain_info.count_of_ways)
+        print('count of variants by modulo', _scan_chain(_load_input_data(filename), modulo=1000000007).count_of_ways)
 
 
 if __name__ == '__main__':
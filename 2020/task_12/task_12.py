@@ -1,6 +1,10 @@
 import abc
-import math
-from typing import List
+import functools
+import itertools
+import sys
+from typing import Iterable, Iterator, List, NamedTuple, Optional, TextIO, Tuple
+
+from aoc import loader
 
 """
       N
@@ -9,29 +13,45 @@ from typing import List
       |
       S
 """
-_WAY_DIRECTIONS_DEGREES = {
-    'N': 90,
-    'S': 270,
-    'E': 0,
-    'W': 180
-}
+# unit vectors by the count of quarter turns counterclockwise from the east, the same are cos and sin of the turns
+_HEADINGS = ((1, 0), (0, 1), (-1, 0), (0, -1))
+_HEADINGS_NAMES = 'ENWS'
 
 _ROTATE_DIRECTIONS_MULTIPLIERS = {
     'R': -1,
     'L': 1
 }
 
+_OP_MOVE = 0
+_OP_FORWARD = 1
+_OP_TURN = 2
+
+_CHUNK_SIZE = 4096
 
-def _get_sin(degrees: int) -> int:
-    radians = math.radians(degrees)
-    value = math.sin(radians)
-    return int(value)
 
+class _Command(NamedTuple):
+    """ Compiled action, only the fields of its opcode are set, quarter turns are counterclockwise """
+    opcode: int
+    shift_x: int = 0
+    shift_y: int = 0
+    distance: int = 0
+    quarter_turns: int = 0
 
-def _get_cos(degrees: int) -> int:
-    radians = math.radians(degrees)
-    value = math.cos(radians)
-    return int(value)
+
+# logs repeat a few hundred distinct actions, so each of them is compiled once
+@functools.lru_cache(maxsize=None)
+def _compile(text: str) -> _Command:
+    name, argument = text[0], int(text[1:])
+    if name in _HEADINGS_NAMES:
+        step_x, step_y = _HEADINGS[_HEADINGS_NAMES.index(name)]
+        return _Command(_OP_MOVE, shift_x=step_x * argument, shift_y=step_y * argument)
+    if name == 'F':
+        return _Command(_OP_FORWARD, distance=argument)
+    if name in _ROTATE_DIRECTIONS_MULTIPLIERS:
+        if argument % 90:
+            raise ValueError(f'turn by {argument} degrees is not a quarter turn')
+        return _Command(_OP_TURN, quarter_turns=_ROTATE_DIRECTIONS_MULTIPLIERS[name] * argument // 90 % 4)
+    raise ValueError(f'unknown action {text}')
 
 
 def _coords_to_str(pos_x: int, pos_y: int) -> str:
@@ -40,6 +60,11 @@ def _coords_to_str(pos_x: int, pos_y: int) -> str:
     return f'{part_y}{abs(pos_y)}:{part_x}{abs(pos_x)}'
 
 
+def _iter_chunks(commands: Iterable[_Command]) -> Iterator[List[_Command]]:
+    commands = iter(commands)
+    return iter(lambda: list(itertools.islice(commands, _CHUNK_SIZE)), [])
+
+
 class _ShipStateBase(abc.ABC):
     def __init__(self):
         self.pos_x = 0
@@ -49,20 +74,20 @@ class _ShipStateBase(abc.ABC):
         return _coords_to_str(self.pos_x, self.pos_y)
 
     @abc.abstractmethod
-    def on_direction(self, direction: str, distance: int) -> None:
-        pass
-
-    @abc.abstractmethod
-    def on_forward(self, distance: int) -> None:
+    def _run(self, commands: Iterable[_Command]) -> None:
         pass
 
-    @abc.abstractmethod
-    def on_rotate(self, degrees: int) -> None:
-        pass
-
-    def apply_actions(self, actions: List['_ShipAction']) -> None:
-        for action in actions:
-            action.apply(self)
+    def apply_commands(self, commands: List[_Command], trace: Optional[TextIO] = None) -> None:
+        """ Runs the commands, the state after every one of them is written to the trace """
+        if trace is None:
+            self._run(commands)
+            return
+        for chunk in _iter_chunks(commands):
+            lines = []
+            for command in chunk:
+                self._run((command,))
+                lines.append(f'{self}\n')
+            trace.writelines(lines)
 
     def get_manhattan_distance(self) -> int:
         return abs(self.pos_x) + abs(self.pos_y)
@@ -72,26 +97,25 @@ class _ShipStateWithDirection(_ShipStateBase):
 
     def __init__(self, direction: str):
         super().__init__()
-        self.degrees = _WAY_DIRECTIONS_DEGREES[direction]
+        self.heading = _HEADINGS_NAMES.index(direction)
 
     def __str__(self):
         coords = super().__str__()
-        direction = next(key for key, value in _WAY_DIRECTIONS_DEGREES.items() if value == self.degrees)
-        return f'{coords} -> {direction}'
-
-    def _move(self, degrees: int, distance: int) -> None:
-        self.pos_x += _get_cos(degrees) * distance
-        self.pos_y += _get_sin(degrees) * distance
-
-    def on_direction(self, direction: str, distance: int) -> None:
-        degrees = _WAY_DIRECTIONS_DEGREES[direction]
-        self._move(degrees, distance)
-
-    def on_forward(self, distance: int) -> None:
-        self._move(self.degrees, distance)
-
-    def on_rotate(self, degrees: int) -> None:
-        self.degrees = (self.degrees + degrees) % 360 % 360
+        return f'{coords} -> {_HEADINGS_NAMES[self.heading]}'
+
+    def _run(self, commands: Iterable[_Command]) -> None:
+        pos_x, pos_y, heading = self.pos_x, self.pos_y, self.heading
+        for opcode, shift_x, shift_y, distance, quarter_turns in commands:
+            if opcode == _OP_MOVE:
+                pos_x += shift_x
+                pos_y += shift_y
+            elif opcode == _OP_FORWARD:
+                step_x, step_y = _HEADINGS[heading]
+                pos_x += step_x * distance
+                pos_y += step_y * distance
+            else:
+                heading = (heading + quarter_turns) % 4
+        self.pos_x, self.pos_y, self.heading = pos_x, pos_y, heading
 
 
 class _Waypoint:
@@ -102,19 +126,6 @@ class _Waypoint:
     def __str__(self):
         return _coords_to_str(self.pos_x, self.pos_y)
 
-    def move(self, degrees: int, distance: int):
-        self.pos_x += _get_cos(degrees) * distance
-        self.pos_y += _get_sin(degrees) * distance
-
-    def turn(self, degrees: int) -> None:
-        # taken from https://en.wikipedia.org/wiki/Rotation_matrix
-        pos_x = self.pos_x
-        pos_y = self.pos_y
-        cos = _get_cos(degrees)
-        sin = _get_sin(degrees)
-        self.pos_x = pos_x * cos - pos_y * sin
-        self.pos_y = pos_x * sin + pos_y * cos
-
 
 class _ShipStateWithWaypoint(_ShipStateBase):
     def __init__(self, pos_x: int, pos_y: int):
@@ -125,55 +136,61 @@ class _ShipStateWithWaypoint(_ShipStateBase):
         coords = super().__str__()
         return f'{coords} -> {self.waypoint}'
 
-    def on_direction(self, direction: str, distance: int) -> None:
-        degrees = _WAY_DIRECTIONS_DEGREES[direction]
-        self.waypoint.move(degrees, distance)
+    def _run(self, commands: Iterable[_Command]) -> None:
+        pos_x, pos_y = self.pos_x, self.pos_y
+        way_x, way_y = self.waypoint.pos_x, self.waypoint.pos_y
+        for opcode, shift_x, shift_y, distance, quarter_turns in commands:
+            if opcode == _OP_MOVE:
+                way_x += shift_x
+                way_y += shift_y
+            elif opcode == _OP_FORWARD:
+                pos_x += way_x * distance
+                pos_y += way_y * distance
+            else:
+                # taken from https://en.wikipedia.org/wiki/Rotation_matrix
+                cos, sin = _HEADINGS[quarter_turns]
+                way_x, way_y = way_x * cos - way_y * sin, way_x * sin + way_y * cos
+        self.pos_x, self.pos_y = pos_x, pos_y
+        self.waypoint.pos_x, self.waypoint.pos_y = way_x, way_y
 
-    def on_forward(self, distance: int) -> None:
-        self.pos_x += self.waypoint.pos_x * distance
-        self.pos_y += self.waypoint.pos_y * distance
 
-    def on_rotate(self, degrees: int) -> None:
-        self.waypoint.turn(degrees)
+def _load_input_data(filename) -> List[_Command]:
+    return [_compile(line) for line in loader.iter_lines(filename) if line]
 
 
-class _ShipAction:
-    def __init__(self, text):
-        self.commmand = text[0]
-        self.argument = int(text[1:])
+def solve_part1(filename: str) -> int:
+    ship_state = _ShipStateWithDirection(direction='E')
+    ship_state.apply_commands(_load_input_data(filename))
+    return ship_state.get_manhattan_distance()
 
-    def _apply_turn(self, state: _ShipStateBase):
-        degrees = _ROTATE_DIRECTIONS_MULTIPLIERS[self.commmand] * self.argument
-        state.on_rotate(degrees)
 
-    def apply(self, state: _ShipStateBase) -> None:
-        if self.commmand in ('N', 'S', 'E', 'W'):
-            state.on_direction(self.commmand, self.argument)
-        if self.commmand == 'F':
-            state.on_forward(self.argument)
-        elif self.commmand in ('R', 'L'):
-            self._apply_turn(state)
-        print(state)
+def solve_part2(filename: str) -> int:
+    ship_state = _ShipStateWithWaypoint(pos_x=10, pos_y=1)
+    ship_state.apply_commands(_load_input_data(filename))
+    return ship_state.get_manhattan_distance()
 
 
-def _load_input_data(filename) -> List[_ShipAction]:
-    with open(filename) as fp:
-        text = fp.read()
-    return [_ShipAction(x) for x in text.splitlines()]
+def solve_stream(lines: Iterable[str]) -> Tuple[int, int]:
+    ship_states = _ShipStateWithDirection(direction='E'), _ShipStateWithWaypoint(pos_x=10, pos_y=1)
+    for chunk in _iter_chunks(_compile(line) for line in lines if line):
+        for ship_state in ship_states:
+            ship_state.apply_commands(chunk)
+    return ship_states[0].get_manhattan_distance(), ship_states[1].get_manhattan_distance()
 
 
 def _main():
     for filename in ('test.txt', 'puzzle.txt'):
         print('\n', filename)
-        actions = _load_input_data(filename)
+        commands = _load_input_data(filename)
+        trace = sys.stdout if filename == 'test.txt' else None
 
         ship_state = _ShipStateWithDirection(direction='E')
-        ship_state.apply_actions(actions)
+        ship_state.apply_commands(commands, trace)
         distance = ship_state.get_manhattan_distance()
         print('use facing, answer is', distance)
 
         ship_state = _ShipStateWithWaypoint(pos_x=10, pos_y=1)
-        ship_state.apply_actions(actions)
+        ship_state.apply_commands(commands, trace)
         distance = ship_state.get_manhattan_distance()
         print('use waypoint, answer is', distance)
 
@@ -1,4 +1,4 @@
-from typing import Tuple, List, NamedTuple, Optional
+from typing import Iterable, Tuple, List, NamedTuple, Optional
 
 
 class _BusInfo(NamedTuple):
@@ -15,7 +15,7 @@ def _load_input_data(filename) -> Tuple[int, List[_BusInfo]]:
         if bus_id == 'x':
             continue
         time = int(bus_id)
-        bus_info = _BusInfo(bus_id=time, offset=time - (index % time))
+        bus_info = _BusInfo(bus_id=time, offset=-index % time)
         buses_infos.append(bus_info)
     return int(depart_time), buses_infos
 
@@ -34,30 +34,67 @@ def _get_waiting_info(depart_time: int, buses_infos: List[_BusInfo]) -> _Waintin
     return result
 
 
-# used https://en.wikipedia.org/wiki/Chinese_remainder_theorem
-def _find_subsequent_by_chinese_remainders(buses_infos: List[_BusInfo]) -> int:
-    all_buses_time = 1
-    for bus_info in buses_infos:
-        all_buses_time *= bus_info.bus_id
-    summa = 0
-    for bus_info in buses_infos:
-        others_buses_time = all_buses_time // bus_info.bus_id
-        summa += bus_info.offset * _multiplicative_inverse(others_buses_time, bus_info.bus_id) * others_buses_time
-    return summa % all_buses_time
+class _Congruence(NamedTuple):
+    """ Timestamps which give the remainder by the modulus """
+    remainder: int
+    modulus: int
+
+    def find_earliest(self, not_before: int = 0) -> int:
+        return not_before + (self.remainder - not_before) % self.modulus
+
+
+def _extended_gcd(first: int, second: int) -> Tuple[int, int]:
+    """ GCD and the factor of the first number in its combination """
+    factor_old, factor_new = 1, 0
+    while second:
+        quotient = first // second
+        first, second = second, first - quotient * second
+        factor_old, factor_new = factor_new, factor_old - quotient * factor_new
+    return first, factor_old
+
+
+# used https://en.wikipedia.org/wiki/Chinese_remainder_theorem#Generalization_to_non-coprime_moduli
+def _merge(first: _Congruence, second: _Congruence) -> Optional[_Congruence]:
+    """ Common congruence of both, None when no timestamp fits them """
+    # the merged modulus grows, so it is reduced before the GCD of small numbers
+    gcd, factor = _extended_gcd(first.modulus % second.modulus, second.modulus)
+    diff = second.remainder - first.remainder
+    if diff % gcd:
+        return None
+    modulus = first.modulus // gcd * second.modulus
+    steps = diff % second.modulus // gcd * factor % (second.modulus // gcd)
+    return _Congruence((first.remainder + first.modulus * steps) % modulus, modulus)
+
+
+class _Schedule:
+    """ Merged congruences of the first buses, for every count of them up to the first inconsistent one """
 
+    def __init__(self, buses_infos: List[_BusInfo]):
+        self.count_of_buses = len(buses_infos)
+        self.prefixes = [_Congruence(remainder=0, modulus=1)]
+        for bus_info in buses_infos:
+            merged = _merge(self.prefixes[-1], _Congruence(bus_info.offset, bus_info.bus_id))
+            if merged is None:
+                break
+            self.prefixes.append(merged)
 
-def _multiplicative_inverse(product, number):
-    if number == 1:
-        return 1
-    remainder = number
-    val_old, val_new = 0, 1
-    while product > 1:
-        quotient = product // remainder
-        product, remainder = remainder, product % remainder
-        val_old, val_new = val_new - quotient * val_old, val_old
-    if val_new < 0:
-        val_new += number
-    return val_new
+    @property
+    def is_consistent(self) -> bool:
+        return len(self.prefixes) > self.count_of_buses
+
+    def find_earliest(self, not_before: int = 0, count_of_buses: Optional[int] = None) -> Optional[int]:
+        """ Earliest timestamp which fits the given count of the first buses, all of them by default """
+        count_of_buses = self.count_of_buses if count_of_buses is None else count_of_buses
+        if count_of_buses >= len(self.prefixes):
+            return None
+        return self.prefixes[count_of_buses].find_earliest(not_before)
+
+    def find_all_earliest(self, queries: Iterable[Tuple[int, Optional[int]]]) -> List[Optional[int]]:
+        return [self.find_earliest(not_before, count_of_buses) for not_before, count_of_buses in queries]
+
+
+def _find_subsequent_by_chinese_remainders(buses_infos: List[_BusInfo]) -> Optional[int]:
+    return _Schedule(buses_infos).find_earliest()
 
 
 def _find_subsequent_by_iterations(buses_infos: List[_BusInfo]) -> int:
@@ -74,6 +111,16 @@ def _find_subsequent_by_iterations(buses_infos: List[_BusInfo]) -> int:
     return timestamp
 
 
+def solve_part1(filename: str) -> int:
+    waiting = _get_waiting_info(*_load_input_data(filename))
+    return waiting.bus_id * waiting.time
+
+
+def solve_part2(filename: str) -> Optional[int]:
+    _, buses_infos = _load_input_data(filename)
+    return _find_subsequent_by_chinese_remainders(buses_infos)
+
+
 def _main():
     for filename in ('test.txt', 'puzzle.txt'):
         print('\n', filename)
@@ -83,8 +130,9 @@ def _main():
         print('bus id', waiting.bus_id, 'wait time', waiting.time,
               'answer is', waiting.bus_id * waiting.time)
 
-        time = _find_subsequent_by_chinese_remainders(buses_infos)
-        print('subsequent by chinese remainders, answer is', time)
+        schedule = _Schedule(buses_infos)
+        print('subsequent by chinese remainders, answer is', schedule.find_earliest())
+        print('subsequent of the first buses', schedule.find_all_earliest((depart_time, x) for x in range(1, 4)))
 
         time = _find_subsequent_by_iterations(buses_infos)
         print('subsequent by iterations, answer is', time)
@@ -1,12 +1,18 @@
 import itertools
 import re
-from typing import List
+from typing import Dict, Iterable, Iterator, List, Tuple
 
 _RE_MASK_TPL = re.compile(r'mask = (?P<mask>[X01]+)')
 _RE_COMMAND_TPL = re.compile(r'mem\[(?P<address>\d+)] = (?P<value>\d+)')
 
 _MASK_LENGTH = 36
 
+# floating bits of test_0.txt masks make part 2 enumerate 2^34 addresses
+INPUTS_by_PART = {
+    1: ('test_0.txt', 'puzzle.txt'),
+    2: ('test_1.txt', 'puzzle.txt')
+}
+
 
 class _CommandInfo:
     def __init__(self, mask, address, value):
@@ -57,21 +63,42 @@ class _CommandInfo:
         return self.address_bits[index] if self.mask[index] == '0' else self.mask[index]
 
 
-def _load_input_data(filename) -> List[_CommandInfo]:
-    with open(filename) as fp:
-        text = fp.read()
-
+def _parse_commands(lines: Iterable[str]) -> Iterator[_CommandInfo]:
     mask = ''.join(itertools.repeat('X', _MASK_LENGTH))
-    commands = []
 
-    for line in text.splitlines():
+    for line in lines:
         match = _RE_MASK_TPL.fullmatch(line) or _RE_COMMAND_TPL.fullmatch(line)
         if match.re == _RE_MASK_TPL:
             mask = match.group('mask')
         else:
-            command = _CommandInfo(mask, match.group('address'), match.group('value'))
-            commands.append(command)
-    return commands
+            yield _CommandInfo(mask, match.group('address'), match.group('value'))
+
+
+def _load_input_data(filename) -> List[_CommandInfo]:
+    with open(filename) as fp:
+        text = fp.read()
+    return list(_parse_commands(text.splitlines()))
+
+
+def solve_part1(filename: str) -> int:
+    results = {cmd.address: cmd.value_by_mask() for cmd in _load_input_data(filename)}
+    return sum(results.values())
+
+
+def solve_part2(filename: str) -> int:
+    results = {address: cmd.value for cmd in _load_input_data(filename) for address in cmd.addresses_by_mask()}
+    return sum(results.values())
+
+
+def solve_stream(lines: Iterable[str]) -> Tuple[int, int]:
+    # only the last value written to every address is kept, not the commands
+    results1 = {}  # type: Dict[int, int]
+    results2 = {}  # type: Dict[int, int]
+    for cmd in _parse_commands(x for x in lines if x):
+        results1[cmd.address] = cmd.value_by_mask()
+        for address in cmd.addresses_by_mask():
+            results2[address] = cmd.value
+    return sum(results1.values()), sum(results2.values())
 
 
 def _main():
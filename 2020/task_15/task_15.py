@@ -63,6 +63,25 @@ class _NumbersGame:
         return self._number
 
 
+def _load_input_data(filename: str) -> List[int]:
+    with open(filename) as fp:
+        return [int(x) for x in fp.read().split(',')]
+
+
+def _play(filename: str, turns: int) -> int:
+    game = _NumbersGame()
+    game.initialize(_load_input_data(filename))
+    return game.play_to_nth_turn(turns)
+
+
+def solve_part1(filename: str) -> int:
+    return _play(filename, 2020)
+
+
+def solve_part2(filename: str) -> int:
+    return _play(filename, 30000000)
+
+
 def _main():
     game = _NumbersGame()
 
@@ -73,7 +92,7 @@ def _main():
         print(datetime.now(), 'answer is', number)
         assert number == test.answer
 
-    game.initialize([15, 5, 1, 4, 7, 0])
+    game.initialize(_load_input_data('puzzle.txt'))
     print(datetime.now(), 'puzzle play to 2020')
     number = game.play_to_nth_turn(2020)
     print('turn 2020, number is', number)
@@ -131,19 +131,42 @@ def _load_input_data(filename) -> Tuple[_RulesList, _TicketInfo, _TicketsList]:
     return rules, my_ticket, nearby_tickets
 
 
+def _validate_tickets(rules: _RulesList, tickets: _TicketsList) -> Tuple[int, List[_TicketInfo]]:
+    validated = []
+    errors_rate = 0
+    for ticket in tickets.items:
+        error = ticket.get_error(rules.items)
+        if error is not None:
+            errors_rate += error
+        else:
+            validated.append(ticket)
+    return errors_rate, validated
+
+
+def solve_part1(filename: str) -> int:
+    rules, _, nearby_tickets = _load_input_data(filename)
+    errors_rate, _ = _validate_tickets(rules, nearby_tickets)
+    return errors_rate
+
+
+def solve_part2(filename: str) -> Optional[int]:
+    rules, my_ticket, nearby_tickets = _load_input_data(filename)
+    _, validated = _validate_tickets(rules, nearby_tickets)
+    if not rules.find_order(validated):
+        return None
+    answer = 1
+    for rule, value in zip(rules.items, my_ticket.values):
+        if rule.name.startswith('departure'):
+            answer *= value
+    return answer
+
+
 def _main():
     for filename in ('test_0.txt', 'test_1.txt', 'puzzle.txt'):
         print('\n', filename)
         rules, my_ticket, nearby_tickets = _load_input_data(filename)
 
-        validated = []
-        errors_rate = 0
-        for ticket in nearby_tickets.items:
-            error = ticket.get_error(rules.items)
-            if error is not None:
-                errors_rate += error
-            else:
-                validated.append(ticket)
+        errors_rate, validated = _validate_tickets(rules, nearby_tickets)
         print('answer is', errors_rate)
 
         if rules.find_order(validated):
@@ -1,7 +1,7 @@
 import operator
 import re
 from collections import deque
-from typing import Deque, Iterable, List, Optional
+from typing import Deque, Iterable, List, Optional, Tuple
 
 
 class _ExpressionsInterpreter:
@@ -64,7 +64,7 @@ class _ExpressionsInterpreter:
             return first
 
     @staticmethod
-    def evaluate_all(texts: List[str], priority: Optional[str], verbose: bool) -> None:
+    def evaluate_all(texts: List[str], priority: Optional[str], verbose: bool) -> int:
         self = _ExpressionsInterpreter(priority)
         print('priority is', self.priority)
         summa = 0
@@ -74,6 +74,7 @@ class _ExpressionsInterpreter:
                 print(text, 'is', result)
             summa += result
         print('summa is', summa)
+        return summa
 
 
 def _load_input_data(filename) -> List[str]:
@@ -82,6 +83,24 @@ def _load_input_data(filename) -> List[str]:
     return text.splitlines()
 
 
+def solve_part1(filename: str) -> int:
+    return _ExpressionsInterpreter.evaluate_all(_load_input_data(filename), priority=None, verbose=False)
+
+
+def solve_part2(filename: str) -> int:
+    return _ExpressionsInterpreter.evaluate_all(_load_input_data(filename), priority='+', verbose=False)
+
+
+def solve_stream(lines: Iterable[str]) -> Tuple[int, int]:
+    interpreters = _ExpressionsInterpreter(priority=None), _ExpressionsInterpreter(priority='+')
+    summas = [0, 0]
+    for text in lines:
+        if text:
+            for index, interpreter in enumerate(interpreters):
+                summas[index] += interpreter.evaluate(text)
+    return summas[0], summas[1]
+
+
 def _main():
     for filename in ('test.txt', 'puzzle.txt'):
         print('\n', filename)
@@ -1,6 +1,12 @@
 import abc
 from typing import Dict, List, Tuple
 
+# the second part replaces rules 8 and 11 with looping ones, see puzzle_1.txt
+INPUTS_by_PART = {
+    1: ('test_0.txt', 'test_1.txt', 'puzzle_0.txt'),
+    2: ('test_2.txt', 'puzzle_1.txt')
+}
+
 
 class _MatchBase(abc.ABC):
     def __init__(self, storage: '_RulesList'):
@@ -102,6 +108,19 @@ def _load_input_data(filename) -> Tuple[_RulesList, List[str]]:
     return rules_list, messages
 
 
+def _count_of_matched(filename: str) -> int:
+    rules_list, messages = _load_input_data(filename)
+    return sum(1 for message in messages if rules_list.is_match(message))
+
+
+def solve_part1(filename: str) -> int:
+    return _count_of_matched(filename)
+
+
+def solve_part2(filename: str) -> int:
+    return _count_of_matched(filename)
+
+
 def _main():
     for filename in ('test_0.txt', 'test_1.txt', 'test_2.txt', 'puzzle_0.txt', 'puzzle_1.txt'):
         print('\n', filename)
@@ -6,6 +6,11 @@ import re
 from collections import defaultdict
 from typing import Dict, Iterable, List, NamedTuple, Set, Tuple
 
+import numpy as np
+
+from aoc import loader
+from aoc.grid import Grid, cover_pattern
+
 _RE_TITLE = re.compile(r'Tile (?P<code>\d+):')
 
 
@@ -175,64 +180,14 @@ class _TileInfo:
         return data
 
 
-class _MaskInfo:
-    def __init__(self, mask: List[List[str]]):
-        self._mask = mask
-
-    def process(self, image: List[List[str]]):
-        image_height = len(image)
-        image_width = len(image[0])
-        for _ in ('normal', 'inversed'):
-            for _ in ('0', '90', '180', '270'):
-                mask_height = len(self._mask)
-                mask_width = len(self._mask[0])
-                for row in range(0, image_height - mask_height + 1):
-                    for col in range(0, image_width - mask_width + 1):
-                        if self._is_match_at(image, row, col):
-                            self._apply_marks(image, row, col)
-                self._rotate()
-            self._flip()
-
-    def _get_markers_in_mask(self) -> Iterable[Tuple[int, int]]:
-        for row_no, row_data in enumerate(self._mask):
-            for col_no, col_data in enumerate(row_data):
-                if col_data == '#':
-                    yield row_no, col_no
-
-    def _is_match_at(self, image: List[List[str]], row: int, col: int) -> bool:
-        for mask_row, mask_col in self._get_markers_in_mask():
-            if image[row + mask_row][col + mask_col] != '#':
-                return False
-        return True
-
-    def _apply_marks(self, image: List[List[str]], row: int, col: int):
-        for mask_row, mask_col in self._get_markers_in_mask():
-            image[row + mask_row][col + mask_col] = 'X'
-
-    def _rotate(self):
-        mask_new = []
-        width = len(self._mask[0])
-        for col in range(width):
-            values = [line[col] for line in self._mask]
-            mask_new.insert(0, values)
-        self._mask = mask_new
-
-    def _flip(self):
-        self._mask = self._mask[::-1]
-
-
 class _NeighborInfo(NamedTuple):
     tile: _TileInfo
     border: int
 
 
 def _load_input_data(filename) -> List[_TileInfo]:
-    with open(filename) as fp:
-        text = fp.read()
-
     tiles = []
-    for tile_text in text.split('\n\n'):
-        lines = tile_text.split('\n')
+    for lines in loader.iter_blocks(filename):
         code = int(_RE_TITLE.fullmatch(lines[0]).group('code'))
         data = [list(line) for line in lines[1:]]
         tile = _TileInfo(code, data)
@@ -297,8 +252,8 @@ def _find_tiles_coords(neighbors: Dict[_TileInfo, List[_NeighborInfo]], initial:
     return coords_to_tiles
 
 
-def _build_image_grid(coords_to_tiles):
-    image_data = []
+def _build_image_grid(coords_to_tiles) -> Grid:
+    image_lines = []
     for row_no in sorted(coords_to_tiles):
         tiles_in_row = coords_to_tiles[row_no]
         tiles_data = []
@@ -306,12 +261,42 @@ def _build_image_grid(coords_to_tiles):
             tile_data = tiles_in_row[col_no].get_data_without_borders()
             tiles_data.append(tile_data)
 
-        while all(tiles_data):
-            image_row = []
-            for tile_data in tiles_data:
-                image_row += tile_data.pop(0)
-            image_data.append(image_row)
-    return image_data
+        for tiles_rows in zip(*tiles_data):
+            image_lines.append(''.join(itertools.chain.from_iterable(tiles_rows)))
+    return Grid.from_lines(image_lines)
+
+
+_SEA_MONSTER = (
+    '                  # ',
+    '#    ##    ##    ###',
+    ' #  #  #  #  #  #   '
+)
+
+
+def _find_corners(grouped_neighbors: Dict[_TileInfo, List[_NeighborInfo]]) -> List[_TileInfo]:
+    return [tile for tile, neighbors in grouped_neighbors.items() if len(neighbors) == 2]
+
+
+def _get_roughness(grouped_neighbors: Dict[_TileInfo, List[_NeighborInfo]], initial: _TileInfo) -> int:
+    tiles_by_coords = _find_tiles_coords(grouped_neighbors, initial)
+    image = _build_image_grid(tiles_by_coords)
+    waves = image.mask('#')
+
+    monsters = np.zeros(waves.shape, dtype=bool)
+    for sea_monster in Grid.from_lines(_SEA_MONSTER).iter_variants():
+        monsters |= cover_pattern(waves, sea_monster.mask('#'))
+    return int(np.count_nonzero(waves & ~monsters))
+
+
+def solve_part1(filename: str) -> int:
+    corners = _find_corners(_find_tiles_neighbors(_load_input_data(filename)))
+    return functools.reduce(operator.mul, [x.code for x in corners])
+
+
+def solve_part2(filename: str) -> int:
+    grouped_neighbors = _find_tiles_neighbors(_load_input_data(filename))
+    corners = _find_corners(grouped_neighbors)
+    return _get_roughness(grouped_neighbors, corners[0])
 
 
 def _main():
@@ -321,28 +306,11 @@ def _main():
         tiles = _load_input_data(filename)
         grouped_neighbors = _find_tiles_neighbors(tiles)
 
-        corners = []
-        for tile, neighbors in grouped_neighbors.items():
-            if len(neighbors) == 2:
-                corners.append(tile)
+        corners = _find_corners(grouped_neighbors)
         prod_of_corners_codes = functools.reduce(operator.mul, [x.code for x in corners])
         print('product of corners codes', prod_of_corners_codes)
 
-        tiles_by_coords = _find_tiles_coords(grouped_neighbors, corners[0])
-        image_data = _build_image_grid(tiles_by_coords)
-
-        mask_data = [
-            list('                  # '),
-            list('#    ##    ##    ###'),
-            list(' #  #  #  #  #  #   ')
-        ]
-        mask_info = _MaskInfo(mask_data)
-        mask_info.process(image_data)
-
-        roughness = 0
-        for item in itertools.chain.from_iterable(image_data):
-            if item == '#':
-                roughness += 1
+        roughness = _get_roughness(grouped_neighbors, corners[0])
         print('habitat`s water roughness', roughness)
 
 
@@ -89,25 +89,39 @@ def _load_input_data(filename) -> _ListOfFoods:
     return list_of_foods
 
 
+def _count_of_safe_usages(list_of_foods: _ListOfFoods) -> int:
+    count = 0
+    for ingredient, foods in list_of_foods.get_foods_with_safe_ingredients():
+        count += len(foods)
+    return count
+
+
+def _get_dangerous(list_of_foods: _ListOfFoods) -> str:
+    while any(list_of_foods.get_allergens_to_update()):
+        list_of_foods.update_allergens_info()
+
+    dangerous = []
+    for allergen in sorted(list_of_foods.allergens_info):
+        ingredient = list_of_foods.allergens_info[allergen]
+        dangerous.append(ingredient)
+    return ','.join(dangerous)
+
+
+def solve_part1(filename: str) -> int:
+    return _count_of_safe_usages(_load_input_data(filename))
+
+
+def solve_part2(filename: str) -> str:
+    return _get_dangerous(_load_input_data(filename))
+
+
 def _main():
     for filename in ('test.txt', 'puzzle.txt'):
         print('\n', filename)
 
         list_of_foods = _load_input_data(filename)
-
-        count = 0
-        for ingredient, foods in list_of_foods.get_foods_with_safe_ingredients():
-            count += len(foods)
-        print('usage of safe ingredients is', count)
-
-        while any(list_of_foods.get_allergens_to_update()):
-            list_of_foods.update_allergens_info()
-
-        dangerous = []
-        for allergen in sorted(list_of_foods.allergens_info):
-            ingredient = list_of_foods.allergens_info[allergen]
-            dangerous.append(ingredient)
-        print('dangerous are', ','.join(dangerous))
+        print('usage of safe ingredients is', _count_of_safe_usages(list_of_foods))
+        print('dangerous are', _get_dangerous(list_of_foods))
 
 
 if __name__ == '__main__':
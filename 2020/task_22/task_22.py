@@ -136,6 +136,20 @@ def _load_input_data(filename) -> Tuple[_DeckInfo, _DeckInfo]:
     return decks[0], decks[1]
 
 
+def _play(filename: str, type_of_comparer: Type[_IComparer]) -> int:
+    deck_1, deck_2 = _load_input_data(filename)
+    game = _CardsGame(deck_1, deck_2, type_of_comparer)
+    return game.play_to_end().get_score()
+
+
+def solve_part1(filename: str) -> int:
+    return _play(filename, _SimpleComparer)
+
+
+def solve_part2(filename: str) -> int:
+    return _play(filename, _SubGameComparer)
+
+
 def _main():
     for filename in ('test_0.txt', 'test_1.txt', 'puzzle.txt'):
         print('\n', filename)
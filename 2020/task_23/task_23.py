@@ -1,10 +1,5 @@
 from typing import Dict, List, cast
 
-_CUPS_LABELS = {
-    'test': '389125467',
-    'puzzle': '624397158'
-}
-
 
 class _CupInfo:
     def __init__(self, label: int):
@@ -99,25 +94,36 @@ class _CupsGame:
         return self.list_of_cups.get_labels_after(label, count)
 
 
-def _main():
-    for name, labels in _CUPS_LABELS.items():
-        print('\n', name)
+def _load_input_data(filename: str) -> List[int]:
+    with open(filename) as fp:
+        return [int(label) for label in fp.read().strip()]
+
+
+def _play(initials: List[int], moves: int) -> _CupsGame:
+    game = _CupsGame(initials)
+    for _ in range(moves):
+        game.do_round()
+    return game
 
-        initials = [int(label) for label in labels]
-        game = _CupsGame(initials)
-        for _ in range(100):
-            game.do_round()
 
-        answer = game.get_after(1, len(labels) - 1)
-        print('100 moves answer is', ''.join(str(x) for x in answer))
+def solve_part1(filename: str) -> str:
+    initials = _load_input_data(filename)
+    answer = _play(initials, 100).get_after(1, len(initials) - 1)
+    return ''.join(str(x) for x in answer)
 
-        initials += range(10, 1000001)
-        game = _CupsGame(initials)
-        for _ in range(10000000):
-            game.do_round()
 
-        answer = game.get_after(1, 2)
-        print('10000000 moves answer is', answer[0] * answer[1])
+def solve_part2(filename: str) -> int:
+    initials = _load_input_data(filename)
+    initials += range(max(initials) + 1, 1000001)
+    answer = _play(initials, 10000000).get_after(1, 2)
+    return answer[0] * answer[1]
+
+
+def _main():
+    for filename in ('test.txt', 'puzzle.txt'):
+        print('\n', filename)
+        print('100 moves answer is', solve_part1(filename))
+        print('10000000 moves answer is', solve_part2(filename))
 
 
 if __name__ == '__main__':
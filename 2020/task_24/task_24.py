@@ -1,8 +1,9 @@
 import enum
-import functools
 import re
 from collections import defaultdict
-from typing import Dict, List, NamedTuple, Set, Tuple
+from typing import Dict, List, NamedTuple, Set
+
+from aoc.automaton import HEX, DenseAutomaton, Rule
 
 
 class _Coords(NamedTuple):
@@ -78,40 +79,12 @@ class _TilesInfo:
         else:
             self._blacks.discard(coords)
 
-    @functools.lru_cache(maxsize=None)
-    def get_coords_nearby(self, coords: _Coords) -> List[_Coords]:
-        list_of_coords = []
-        for offset in OFFSETS.values():
-            list_of_coords.append(coords + offset)
-        return list_of_coords
-
-    def get_neighbors(self, coords: _Coords) -> Tuple[List[_Coords], List[_Coords]]:
-        blacks = []
-        whites = []
-        for neighbor in self.get_coords_nearby(coords):
-            if neighbor in self._blacks:
-                blacks.append(neighbor)
-            else:
-                whites.append(neighbor)
-        return blacks, whites
-
-    def emulate_day(self):
-        tiles_to_flip = []
-        whites_to_check = set()
-
-        for coords in self._blacks:
-            blacks, whites = self.get_neighbors(coords)
-            whites_to_check.update(whites)
-            if len(blacks) == 0 or len(blacks) > 2:
-                tiles_to_flip.append(coords)
-
-        for coords in whites_to_check:
-            blacks, _ = self.get_neighbors(coords)
-            if len(blacks) == 2:
-                tiles_to_flip.append(coords)
-
-        for coords in tiles_to_flip:
-            self.flip_tile(coords)
+    def emulate_days(self, days: int):
+        # tiles are cells of the hexagonal automaton in the same doubled coordinates
+        rule = Rule.build(born=(2,), survive=(1, 2))
+        automaton = DenseAutomaton.from_coords(((y, x) for x, y in self._blacks), HEX, rule)
+        automaton.run(days)
+        self._blacks = {_Coords(x=x, y=y) for y, x in automaton.get_active()}
 
     def count_of_blacks(self):
         return len(self._blacks)
@@ -123,6 +96,23 @@ def _load_input_data(filename: str) -> List[_StepsList]:
     return [_StepsList(x) for x in text.splitlines()]
 
 
+def _walk_all(filename: str) -> _TilesInfo:
+    tiles_info = _TilesInfo()
+    for steps_list in _load_input_data(filename):
+        tiles_info.walk_tiles(steps_list)
+    return tiles_info
+
+
+def solve_part1(filename: str) -> int:
+    return _walk_all(filename).count_of_blacks()
+
+
+def solve_part2(filename: str) -> int:
+    tiles_info = _walk_all(filename)
+    tiles_info.emulate_days(100)
+    return tiles_info.count_of_blacks()
+
+
 def _main():
     for filename in ('test.txt', 'puzzle.txt'):
         print('\n', filename)
@@ -136,8 +126,7 @@ def _main():
         count_of_blacks = tiles_info.count_of_blacks()
         print('count of blacks', count_of_blacks)
 
-        for day in range(100):
-            tiles_info.emulate_day()
+        tiles_info.emulate_days(100)
         print('count of blacks', tiles_info.count_of_blacks())
 
 
@@ -9,11 +9,6 @@ class _PublicKeys(NamedTuple):
 _SUBJECT_NUMBER = 7
 _VALUES_HIGH_BOUND = 20201227
 
-_PUBLIC_KEYS_to_CHECK = {
-    'test': _PublicKeys(card=5764801, door=17807724),
-    'puzzle': _PublicKeys(card=11349501, door=5107328)
-}
-
 
 def _do_transform_step(value: int, subject: int) -> int:
     return (value * subject) % _VALUES_HIGH_BOUND
@@ -26,9 +21,30 @@ def _do_transform_loop(subject: int, loop_size: int) -> int:
     return value
 
 
+def _load_input_data(filename: str) -> _PublicKeys:
+    with open(filename) as fp:
+        card, door = map(int, fp.read().split())
+    return _PublicKeys(card=card, door=door)
+
+
+def _find_loop_size(public_key: int) -> int:
+    value = 1
+    index = 0
+    while value != public_key:
+        value = _do_transform_step(value, _SUBJECT_NUMBER)
+        index += 1
+    return index
+
+
+def solve_part1(filename: str) -> int:
+    public_key = _load_input_data(filename)
+    return _do_transform_loop(public_key.door, _find_loop_size(public_key.card))
+
+
 def _main():
-    for name, publick_key in _PUBLIC_KEYS_to_CHECK.items():
-        print('\n', name)
+    for filename in ('test.txt', 'puzzle.txt'):
+        print('\n', filename)
+        publick_key = _load_input_data(filename)
 
         card_loop_size = None
         door_loop_size = None
@@ -1,35 +1,64 @@
-from typing import List
+from collections import deque
+from typing import Iterable, Iterator, Tuple
 
+from aoc import loader
 
-def _load_input_data(filename: str) -> List[int]:
-    with open(filename) as fp:
-        return [int(x) for x in fp.readlines() if x]
 
+def _parse_depths(lines: Iterable[str]) -> Iterator[int]:
+    return (int(x) for x in lines if x)
 
-def _get_sum(depths: List[int], offset: int, length: int) -> int:
-    result = 0
-    for index in range(length):
-        result += depths[offset + index]
-    return result
+
+def _load_input_data(filename: str) -> Iterator[int]:
+    return _parse_depths(loader.iter_lines(filename))
+
+
+class _IncreasesCounter:
+    def __init__(self, maxlen: int):
+        self._window = deque(maxlen=maxlen)
+        self._previous = None
+        self.increases = 0
+
+    def add(self, depth: int):
+        self._window.append(depth)
+        if len(self._window) < self._window.maxlen:
+            return
+        current = sum(self._window)
+        if self._previous is not None and current > self._previous:
+            self.increases += 1
+        self._previous = current
+
+
+def _count_of_increases(depths: Iterable[int], maxlen: int) -> int:
+    counter = _IncreasesCounter(maxlen)
+    for depth in depths:
+        counter.add(depth)
+    return counter.increases
+
+
+def solve_part1(filename: str) -> int:
+    return _count_of_increases(_load_input_data(filename), 1)
+
+
+def solve_part2(filename: str) -> int:
+    return _count_of_increases(_load_input_data(filename), 3)
+
+
+def solve_stream(lines: Iterable[str]) -> Tuple[int, int]:
+    counters = _IncreasesCounter(1), _IncreasesCounter(3)
+    for depth in _parse_depths(lines):
+        for counter in counters:
+            counter.add(depth)
+    return counters[0].increases, counters[1].increases
 
 
 def _main():
     for filename in ('test.txt', 'puzzle.txt'):
         print('loading', filename)
-        depths = _load_input_data(filename)
+        depths = list(_load_input_data(filename))
 
         for maxlen in (1, 3):
             print('window size', maxlen)
-            increases = 0
-
-            previous = _get_sum(depths, 0, maxlen)
-            for offset in range(1, len(depths) - maxlen + 1):
-                current = _get_sum(depths, offset, maxlen)
-                if current > previous:
-                    increases += 1
-                previous = current
-
-            print('the number of increases', increases)
+            print('the number of increases', _count_of_increases(depths, maxlen))
 
 
 if __name__ == '__main__':
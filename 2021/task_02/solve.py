@@ -1,9 +1,10 @@
-from typing import List, Tuple
+from typing import Iterable, Iterator, Tuple
 
+from aoc import loader
 
-def _load_input_data(filename: str) -> List[str]:
-    with open(filename) as fp:
-        return [x for x in fp.readlines() if x]
+
+def _load_input_data(filename: str) -> Iterator[str]:
+    return (x for x in loader.iter_lines(filename) if x)
 
 
 def _parse_command(command: str) -> Tuple[str, int]:
@@ -11,25 +12,51 @@ def _parse_command(command: str) -> Tuple[str, int]:
     return name, int(value)
 
 
+class _Submarine:
+    def __init__(self):
+        self.h_pos = 0
+        self.depth = 0
+        # the aim follows the same commands as the depth in the first part
+        self.aim = 0
+
+    def execute(self, name: str, value: int):
+        if name == 'forward':
+            self.h_pos += value
+            self.depth += self.aim * value
+        elif name == 'down':
+            self.aim += value
+        elif name == 'up':
+            self.aim -= value
+
+
+def _drive(commands: Iterable[str]) -> _Submarine:
+    submarine = _Submarine()
+    for name, value in map(_parse_command, commands):
+        submarine.execute(name, value)
+    return submarine
+
+
+def solve_part1(filename: str) -> int:
+    submarine = _drive(_load_input_data(filename))
+    return submarine.h_pos * submarine.aim
+
+
+def solve_part2(filename: str) -> int:
+    submarine = _drive(_load_input_data(filename))
+    return submarine.h_pos * submarine.depth
+
+
+def solve_stream(lines: Iterable[str]) -> Tuple[int, int]:
+    submarine = _drive(x for x in lines if x)
+    return submarine.h_pos * submarine.aim, submarine.h_pos * submarine.depth
+
+
 def _main():
     for filename in ('test.txt', 'puzzle.txt'):
         print('loading', filename)
-        commands = _load_input_data(filename)
-
-        h_pos = 0
-        depth = 0
-        aim = 0
-
-        for name, value in map(_parse_command, commands):
-            if name == 'forward':
-                h_pos += value
-                depth += aim * value
-            elif name == 'down':
-                aim += value
-            elif name == 'up':
-                aim -= value
-
-        print('position is', h_pos * depth)
+        submarine = _drive(_load_input_data(filename))
+        print('simple position is', submarine.h_pos * submarine.aim)
+        print('position is', submarine.h_pos * submarine.depth)
 
 
 if __name__ == '__main__':
@@ -70,6 +70,15 @@ def _calc_co2(records: _TRecords) -> int:
     return _bits_to_int(record)
 
 
+def solve_part1(filename: str) -> int:
+    return _calc_power_consumption(_load_file(filename))
+
+
+def solve_part2(filename: str) -> int:
+    records = _load_file(filename)
+    return _calc_oxygen(records) * _calc_co2(records)
+
+
 def _main():
     for filename in ('test.txt', 'puzzle.txt'):
         print('loading', filename)
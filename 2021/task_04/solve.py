@@ -69,26 +69,42 @@ def _load_file(filename: str) -> Tuple[Numbers, Boards]:
         return Numbers(numbers), Boards(boards)
 
 
+def _play_to_first_winner(numbers: Numbers, boards: Boards) -> Tuple[Board, int]:
+    winner = cast(Board, None)
+    number = cast(int, None)
+    while numbers and not winner:
+        number = numbers.pop(0)
+        boards.mark_value(number)
+        winner = boards.get_winner()
+    return winner, number
+
+
+def _play_to_last_winner(numbers: Numbers, boards: Boards) -> Tuple[Board, int]:
+    winner, number = _play_to_first_winner(numbers, boards)
+    boards.remove(winner)
+    while numbers and boards:
+        number = numbers.pop(0)
+        boards.mark_value(number)
+        for winner in [x for x in boards if x.is_winner()]:
+            boards.remove(winner)
+    return winner, number
+
+
+def solve_part1(filename: str) -> int:
+    winner, number = _play_to_first_winner(*_load_file(filename))
+    return number * winner.score()
+
+
+def solve_part2(filename: str) -> int:
+    winner, number = _play_to_last_winner(*_load_file(filename))
+    return number * winner.score()
+
+
 def _main():
     for filename in ('test.txt', 'puzzle.txt'):
         print('loading', filename)
-        numbers, boards = _load_file(filename)
-
-        winner = cast(Board, None)
-        number = cast(int, None)
-        while numbers and not winner:
-            number = numbers.pop(0)
-            boards.mark_value(number)
-            winner = boards.get_winner()
-        print('first winner score', number * winner.score())
-
-        boards.remove(winner)
-        while numbers and boards:
-            number = numbers.pop(0)
-            boards.mark_value(number)
-            for winner in [x for x in boards if x.is_winner()]:
-                boards.remove(winner)
-        print('last winner score', number * winner.score())
+        print('first winner score', solve_part1(filename))
+        print('last winner score', solve_part2(filename))
 
 
 if __name__ == '__main__':
@@ -1,24 +1,24 @@
 import heapq
-from typing import List, Iterable, Any
+from typing import List, Iterable, Any, Tuple
+
+from aoc import loader
 
 TCalories = List[int]
 
 
-def _split_by_empty_lines(lines: Iterable[str]):
-    values = []
-    for line in lines:
-        if line:
-            values.append(int(line))
-        else:
-            yield values
-            values = []
-    yield values
+def parse_data(lines: Iterable[str]) -> Iterable[TCalories]:
+    for block in loader.group_blocks(lines):
+        yield [int(x) for x in block]
+
 
+def load_data(path: str) -> Iterable[TCalories]:
+    return parse_data(loader.iter_lines(path))
 
-def load_data(path: str) -> List[TCalories]:
-    with open(path) as fp:
-        lines = map(str.strip, fp.readlines())
-        return [x for x in _split_by_empty_lines(lines) if x]
+
+def push_top(tops: List[int], total: int, count: int):
+    heapq.heappush(tops, total)
+    if len(tops) > count:
+        heapq.heappop(tops)
 
 
 def check_answer(actual: Any, expected: Any):
@@ -26,24 +26,32 @@ def check_answer(actual: Any, expected: Any):
     print("answer is", actual)
 
 
-def solve_part1(path: str, expected: Any):
+def solve_part1(path: str, expected: Any = None) -> int:
     print("solve part1", path)
     answer = 0
     for calories in load_data(path):
         total = sum(calories)
         answer = max(answer, total)
     check_answer(answer, expected)
+    return answer
 
 
-def solve_part2(path: str, expected: Any):
+def solve_part2(path: str, expected: Any = None) -> int:
     print("solve", path)
     tops = []
     for calories in load_data(path):
-        total = sum(calories)
-        heapq.heappush(tops, total)
-        if len(tops) > 3:
-            heapq.heappop(tops)
-    check_answer(sum(tops), expected)
+        push_top(tops, sum(calories), 3)
+    answer = sum(tops)
+    check_answer(answer, expected)
+    return answer
+
+
+def solve_stream(lines: Iterable[str]) -> Tuple[int, int]:
+    # the largest of the top three is the answer of the first part
+    tops = []
+    for calories in parse_data(lines):
+        push_top(tops, sum(calories), 3)
+    return max(tops, default=0), sum(tops)
 
 
 def main():
@@ -1,5 +1,7 @@
 import enum
-from typing import List, NamedTuple, Tuple, Any
+from typing import Iterable, NamedTuple, Tuple, Any
+
+from aoc import loader
 
 
 class Shape(enum.Enum):
@@ -44,10 +46,12 @@ def parse_line(line: str) -> Round:
     return Round(*cols)
 
 
-def load_data(path: str) -> List[Round]:
-    with open(path) as fp:
-        lines = map(str.strip, fp.readlines())
-        return [parse_line(x) for x in lines]
+def parse_data(lines: Iterable[str]) -> Iterable[Round]:
+    return map(parse_line, (x for x in lines if x))
+
+
+def load_data(path: str) -> Iterable[Round]:
+    return parse_data(loader.iter_lines(path))
 
 
 def get_my_turn_part1(col2: str) -> Shape:
@@ -64,19 +68,25 @@ def check_answer(actual: Any, expected: Any):
     print("answer is", actual)
 
 
-def solve_part1(path: str, expected: Any):
+def get_score_part1(col1: str, col2: str) -> int:
+    shape1 = SHAPE_by_CHAR[col1]
+    shape2 = get_my_turn_part1(col2)
+    score = SCORE_by_SHAPE[shape2]
+    if shape1 == shape2:
+        score += 3
+    elif shape2 == BEATS_by_SHAPE[shape1]:
+        score += 6
+    return score
+
+
+def solve_part1(path: str, expected: Any = None) -> int:
     print("solve part1", path)
     data = load_data(path)
     answer = 0
     for col1, col2 in data:
-        shape1 = SHAPE_by_CHAR[col1]
-        shape2 = get_my_turn_part1(col2)
-        answer += SCORE_by_SHAPE[shape2]
-        if shape1 == shape2:
-            answer += 3
-        elif shape2 == BEATS_by_SHAPE[shape1]:
-            answer += 6
+        answer += get_score_part1(col1, col2)
     check_answer(answer, expected)
+    return answer
 
 
 def get_my_turn_part2(col2: str, shape1: Shape) -> Tuple[Shape, int]:
@@ -88,15 +98,28 @@ def get_my_turn_part2(col2: str, shape1: Shape) -> Tuple[Shape, int]:
         return BEATS_by_SHAPE[shape1], 6
 
 
-def solve_part2(path: str, expected: Any):
+def get_score_part2(col1: str, col2: str) -> int:
+    shape1 = SHAPE_by_CHAR[col1]
+    shape2, bonus = get_my_turn_part2(col2, shape1)
+    return SCORE_by_SHAPE[shape2] + bonus
+
+
+def solve_part2(path: str, expected: Any = None) -> int:
     print("solve part2", path)
     data = load_data(path)
     answer = 0
     for col1, col2 in data:
-        shape1 = SHAPE_by_CHAR[col1]
-        shape2, bonus = get_my_turn_part2(col2, shape1)
-        answer += SCORE_by_SHAPE[shape2] + bonus
+        answer += get_score_part2(col1, col2)
     check_answer(answer, expected)
+    return answer
+
+
+def solve_stream(lines: Iterable[str]) -> Tuple[int, int]:
+    answer1 = answer2 = 0
+    for col1, col2 in parse_data(lines):
+        answer1 += get_score_part1(col1, col2)
+        answer2 += get_score_part2(col1, col2)
+    return answer1, answer2
 
 
 def main():
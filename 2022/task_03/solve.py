@@ -1,5 +1,7 @@
 import string
-from typing import List, NamedTuple, Any
+from typing import Iterable, NamedTuple, Any, List, Tuple
+
+from aoc import loader
 
 
 class Rucksack(NamedTuple):
@@ -17,10 +19,8 @@ PRIORITIES = {
 }
 
 
-def load_data(path: str) -> List[str]:
-    with open(path) as fp:
-        lines = map(str.strip, fp.readlines())
-        return list(lines)
+def load_data(path: str) -> Iterable[str]:
+    return loader.iter_lines(path)
 
 
 def check_answer(actual: Any, expected: Any):
@@ -28,21 +28,34 @@ def check_answer(actual: Any, expected: Any):
     print("answer is", actual)
 
 
-def solve_part1(path: str, expected: Any):
+def get_common_priority(rucksack: str) -> int:
+    half = len(rucksack) // 2
+    cell1 = rucksack[:half]
+    cell2 = rucksack[half:]
+    commons = set(cell1) & set(cell2)
+    assert len(commons) == 1, (cell1, cell2)
+    item = next(iter(commons))
+    return PRIORITIES[item]
+
+
+def get_badge_priority(group: List[str]) -> int:
+    first, second, third = group
+    commons = set(first) & set(second) & set(third)
+    assert len(commons) == 1, (first, second, third)
+    same_item = next(iter(commons))
+    return PRIORITIES[same_item]
+
+
+def solve_part1(path: str, expected: Any = None) -> int:
     print("solve part1", path)
     answer = 0
     for rucksack in load_data(path):
-        half = len(rucksack) // 2
-        cell1 = rucksack[:half]
-        cell2 = rucksack[half:]
-        commons = set(cell1) & set(cell2)
-        assert len(commons) == 1, (cell1, cell2)
-        item = next(iter(commons))
-        answer += PRIORITIES[item]
+        answer += get_common_priority(rucksack)
     check_answer(answer, expected)
+    return answer
 
 
-def solve_part2(path: str, expected: Any):
+def solve_part2(path: str, expected: Any = None) -> int:
     print("solve part2", path)
     answer = 0
     group = []
@@ -50,13 +63,23 @@ def solve_part2(path: str, expected: Any):
         group.append(rucksack)
         if len(group) < 3:
             continue
-        first, second, third = group
+        answer += get_badge_priority(group)
         group = []
-        commons = set(first) & set(second) & set(third)
-        assert len(commons) == 1, (first, second, third)
-        same_item = next(iter(commons))
-        answer += PRIORITIES[same_item]
     check_answer(answer, expected)
+    return answer
+
+
+def solve_stream(lines: Iterable[str]) -> Tuple[int, int]:
+    # only the current group of three rucksacks is kept
+    answer1 = answer2 = 0
+    group = []
+    for rucksack in (x for x in lines if x):
+        answer1 += get_common_priority(rucksack)
+        group.append(rucksack)
+        if len(group) == 3:
+            answer2 += get_badge_priority(group)
+            group = []
+    return answer1, answer2
 
 
 def main():
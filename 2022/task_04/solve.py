@@ -1,4 +1,6 @@
-from typing import NamedTuple, Iterable, Any
+from typing import NamedTuple, Iterable, Any, Tuple
+
+from aoc import loader
 
 
 class RangeInfo(NamedTuple):
@@ -26,11 +28,19 @@ class RangesPair(NamedTuple):
         parts = map(RangeInfo.build, text.split(","))
         return RangesPair(*parts)
 
+    def is_full_overlap(self) -> bool:
+        return self.range1.is_contains(self.range2) or self.range2.is_contains(self.range1)
+
+    def has_overlap(self) -> bool:
+        return self.range1.has_overlap(self.range2)
+
+
+def parse_data(lines: Iterable[str]) -> Iterable[RangesPair]:
+    return map(RangesPair.build, (x for x in lines if x))
+
 
 def load_data(path: str) -> Iterable[RangesPair]:
-    with open(path) as fp:
-        lines = map(str.strip, fp.readlines())
-    return map(RangesPair.build, lines)
+    return parse_data(loader.iter_lines(path))
 
 
 def check_answer(actual: Any, expected: Any):
@@ -38,25 +48,33 @@ def check_answer(actual: Any, expected: Any):
     print("answer is", actual)
 
 
-def solve_part1(path: str, expected: Any):
+def solve_part1(path: str, expected: Any = None) -> int:
     print("solve part1", path)
     answer = 0
     for pair in load_data(path):
-        first, second = pair.range1, pair.range2
-        if first.is_contains(second) or second.is_contains(first):
+        if pair.is_full_overlap():
             answer += 1
     check_answer(answer, expected)
+    return answer
 
 
-def solve_part2(path: str, expected: Any):
+def solve_part2(path: str, expected: Any = None) -> int:
     print("solve part2", path)
     answer = 0
     for pair in load_data(path):
-        first, second = pair.range1, pair.range2
-        if first.has_overlap(second):
+        if pair.has_overlap():
             answer += 1
     assert expected is None or answer == expected, (answer, expected)
     check_answer(answer, expected)
+    return answer
+
+
+def solve_stream(lines: Iterable[str]) -> Tuple[int, int]:
+    answer1 = answer2 = 0
+    for pair in parse_data(lines):
+        answer1 += pair.is_full_overlap()
+        answer2 += pair.has_overlap()
+    return answer1, answer2
 
 
 def main():
@@ -0,0 +1,84 @@
+import json
+import os
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+from aoc.tasks import ROOT_DIR, JobInfo
+
+DEFAULT_PATH = os.path.join(ROOT_DIR, 'answers.json')
+
+STATUS_OK = 'ok'
+STATUS_WRONG = 'wrong'
+STATUS_MISSING = 'missing'
+STATUS_ERROR = 'error'
+
+
+class Verification(NamedTuple):
+    job: JobInfo
+    status: str
+    expected: Any
+    actual: Any
+    elapsed: float
+    error: Optional[str] = None
+
+    def to_json(self) -> Dict:
+        return {
+            'task': self.job.task.name,
+            'part': self.job.part,
+            'input': self.job.input_name,
+            'status': self.status,
+            'expected': self.expected,
+            'actual': self.actual,
+            'elapsed': self.elapsed,
+            'error': self.error
+        }
+
+
+def load_answers(path: str = DEFAULT_PATH) -> Dict[str, Any]:
+    """ Expected answers by job names, e.g. '2020/task_01 part1 puzzle.txt' """
+    if not os.path.exists(path):
+        return {}
+    with open(path) as fp:
+        return json.load(fp)
+
+
+def save_answers(path: str, answers: Dict[str, Any]) -> None:
+    data = load_answers(path)
+    data.update(answers)
+    with open(path, 'w') as fp:
+        json.dump({name: data[name] for name in sorted(data)}, fp, indent=2)
+        fp.write('\n')
+
+
+def verify(job: JobInfo, answers: Dict[str, Any], actual: Any, elapsed: float,
+           error: Optional[str] = None) -> Verification:
+    expected = answers.get(job.name)
+    if error:
+        status = STATUS_ERROR
+    elif job.name not in answers:
+        status = STATUS_MISSING
+    else:
+        # answers pass through JSON, so tuples and lists are the same
+        status = STATUS_OK if json.loads(json.dumps(actual)) == expected else STATUS_WRONG
+    return Verification(job=job, status=status, expected=expected, actual=actual, elapsed=elapsed, error=error)
+
+
+def count_by_status(verifications: Iterable[Verification]) -> Dict[str, int]:
+    counts = dict.fromkeys((STATUS_OK, STATUS_WRONG, STATUS_MISSING, STATUS_ERROR), 0)
+    for verification in verifications:
+        counts[verification.status] += 1
+    return counts
+
+
+def save_report(path: str, verifications: Sequence[Verification]) -> None:
+    report = {
+        'summary': count_by_status(verifications),
+        'elapsed': sum(x.elapsed for x in verifications),
+        'jobs': [x.to_json() for x in verifications]
+    }
+    with open(path, 'w') as fp:
+        json.dump(report, fp, indent=2)
+        fp.write('\n')
+
+
+def get_failures(verifications: Iterable[Verification]) -> List[Verification]:
+    return [x for x in verifications if x.status in (STATUS_WRONG, STATUS_ERROR)]
@@ -0,0 +1,273 @@
+import abc
+import itertools
+from collections import Counter
+from typing import FrozenSet, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+import numpy as np
+
+from aoc.grid import build_neighbor_table, count_neighbors, count_visible
+
+TCoords = Tuple[int, ...]
+
+
+class Rule(NamedTuple):
+    born: FrozenSet[int]
+    survive: FrozenSet[int]
+
+    @staticmethod
+    def build(born: Iterable[int], survive: Iterable[int]) -> 'Rule':
+        return Rule(born=frozenset(born), survive=frozenset(survive))
+
+
+LIFE = Rule.build(born=(3,), survive=(2, 3))
+
+
+class Neighborhood(NamedTuple):
+    offsets: Tuple[TCoords, ...]
+    # neighbours are the first cells seen in the directions of the offsets
+    line_of_sight: bool = False
+
+    @property
+    def dimensions(self) -> int:
+        return len(self.offsets[0])
+
+    @property
+    def reach(self) -> int:
+        return max(abs(step) for offset in self.offsets for step in offset)
+
+
+def moore(dimensions: int, line_of_sight: bool = False) -> Neighborhood:
+    offsets = tuple(x for x in itertools.product((-1, 0, 1), repeat=dimensions) if any(x))
+    return Neighborhood(offsets, line_of_sight)
+
+
+# hexagons in (row, col) with doubled columns: east and west are two columns away
+HEX = Neighborhood(offsets=((0, 2), (0, -2), (1, 1), (1, -1), (-1, 1), (-1, -1)))
+
+
+class Automaton(abc.ABC):
+    def __init__(self, neighborhood: Neighborhood, rule: Rule):
+        self.neighborhood = neighborhood
+        self.rule = rule
+        self.generation = 0
+        self.changes = []  # type: List[int]
+
+    @abc.abstractmethod
+    def _step(self) -> int:
+        pass
+
+    @abc.abstractmethod
+    def count_of_active(self) -> int:
+        pass
+
+    @abc.abstractmethod
+    def get_active(self) -> Set[TCoords]:
+        pass
+
+    def step(self) -> int:
+        """ Moves to the next generation, returns the count of changed cells """
+        changed = self._step()
+        self.generation += 1
+        self.changes.append(changed)
+        return changed
+
+    def run(self, generations: int) -> None:
+        for _ in range(generations):
+            self.step()
+
+    def run_until_stable(self) -> int:
+        while self.step():
+            pass
+        return self.generation
+
+
+class DenseAutomaton(Automaton):
+    """ Cells in a boolean array, without the fixed cells mask the array grows with the pattern """
+
+    def __init__(self, active: np.ndarray, neighborhood: Neighborhood, rule: Rule,
+                 cells: Optional[np.ndarray] = None, origin: Optional[TCoords] = None):
+        super().__init__(neighborhood, rule)
+        if active.ndim != neighborhood.dimensions:
+            raise ValueError(f'{active.ndim}D cells for a {neighborhood.dimensions}D neighborhood')
+        if neighborhood.line_of_sight and (cells is None or active.ndim != 2):
+            raise ValueError('line of sight needs 2D cells with a fixed mask')
+        self.active = active.astype(bool)
+        self.cells = cells
+        self.origin = origin or (0,) * active.ndim
+        self._born = self._build_table(rule.born)
+        self._survive = self._build_table(rule.survive)
+
+    @staticmethod
+    def from_coords(coords: Iterable[TCoords], neighborhood: Neighborhood, rule: Rule) -> 'DenseAutomaton':
+        coords = np.array(list(coords), dtype=np.int64).reshape(-1, neighborhood.dimensions)
+        low = coords.min(axis=0) if len(coords) else np.zeros(neighborhood.dimensions, dtype=np.int64)
+        high = coords.max(axis=0) if len(coords) else low
+        active = np.zeros(high - low + 1, dtype=bool)
+        active[tuple((coords - low).T)] = True
+        return DenseAutomaton(active, neighborhood, rule, origin=tuple(int(x) for x in low))
+
+    def _build_table(self, counts: FrozenSet[int]) -> np.ndarray:
+        table = np.zeros(len(self.neighborhood.offsets) + 1, dtype=bool)
+        table[[x for x in counts if x < len(table)]] = True
+        return table
+
+    def _grow(self) -> None:
+        reach = self.neighborhood.reach
+        indices = np.nonzero(self.active)
+        if not indices[0].size:
+            return
+        # room for two generations at once keeps the padding rare
+        padding = [
+            (2 * reach if low < reach else 0, 2 * reach if size - 1 - high < reach else 0)
+            for low, high, size in ((x.min(), x.max(), size) for x, size in zip(indices, self.active.shape))
+        ]
+        if any(before or after for before, after in padding):
+            self.active = np.pad(self.active, padding)
+            self.origin = tuple(x - before for x, (before, _) in zip(self.origin, padding))
+
+    def _count_neighbors(self) -> np.ndarray:
+        if self.neighborhood.line_of_sight:
+            return count_visible(self.active, ~self.cells, self.neighborhood.offsets)
+        return count_neighbors(self.active, self.neighborhood.offsets)
+
+    def _step(self) -> int:
+        if self.cells is None:
+            self._grow()
+        neighbors = self._count_neighbors()
+        active = np.where(self.active, self._survive[neighbors], self._born[neighbors])
+        if self.cells is not None:
+            active &= self.cells
+        changed = int(np.count_nonzero(active != self.active))
+        self.active = active
+        return changed
+
+    def count_of_active(self) -> int:
+        return int(np.count_nonzero(self.active))
+
+    def get_active(self) -> Set[TCoords]:
+        indices = np.argwhere(self.active) + np.array(self.origin, dtype=np.int64)
+        return {tuple(int(x) for x in coords) for coords in indices}
+
+
+class TableAutomaton(Automaton):
+    """ Fixed 2D cells with a precomputed table of neighbor IDs, states are swapped between two buffers
+
+    The incremental one checks only the cells next to the changed ones, once they are few enough.
+    """
+
+    def __init__(self, active: np.ndarray, neighborhood: Neighborhood, rule: Rule, cells: np.ndarray,
+                 incremental: bool = False):
+        super().__init__(neighborhood, rule)
+        if active.ndim != 2 or neighborhood.dimensions != 2:
+            raise ValueError('table automaton needs 2D cells and neighborhood')
+        if incremental and set(neighborhood.offsets) != {(-row, -col) for row, col in neighborhood.offsets}:
+            raise ValueError('incremental automaton needs a symmetric neighborhood')
+        self.cells = cells.astype(bool)
+        self._neighbors = build_neighbor_table(self.cells, neighborhood.offsets, neighborhood.line_of_sight)
+        count_of_cells = self._neighbors.shape[1]
+
+        # the state after the last cell is the inactive missing neighbor
+        self._states = np.zeros(count_of_cells + 1, dtype=np.uint8)
+        self._states[:count_of_cells] = active[self.cells]
+        self._next_states = np.zeros_like(self._states)
+        self._transitions = self._build_transitions()
+        # buffers of the step, to be reused by every generation
+        self._gathered = np.empty(count_of_cells, dtype=np.uint8)
+        self._keys = np.empty(count_of_cells, dtype=np.intp)
+        self._is_changed = np.empty(count_of_cells, dtype=bool)
+        # IDs of the cells to check in the next generation, all of them for the full step
+        self._frontier = np.arange(count_of_cells) if incremental else None  # type: Optional[np.ndarray]
+        self._stamps = np.empty(count_of_cells + 1, dtype=np.intp) if incremental else None
+
+    def _build_transitions(self) -> np.ndarray:
+        """ Next states by the keys: the state times the neighbors count limit plus the count """
+        size = len(self.neighborhood.offsets) + 1
+        transitions = np.zeros(2 * size, dtype=np.uint8)
+        transitions[[x for x in self.rule.born if x < size]] = 1
+        transitions[[size + x for x in self.rule.survive if x < size]] = 1
+        return transitions
+
+    def _step(self) -> int:
+        if self._frontier is None:
+            return self._step_all()
+        # a wide frontier is cheaper to check with the whole buffers, and to mark its neighbors in a mask
+        if 4 * len(self._frontier) > len(self._keys):
+            self._step_all()
+            changed = np.flatnonzero(self._is_changed)
+            if 4 * len(changed) > len(self._keys):
+                return len(changed)
+            is_near = np.zeros(len(self._keys) + 1, dtype=bool)
+            is_near[changed] = True
+            for neighbors in self._neighbors:
+                is_near[neighbors[changed]] = True
+            self._frontier = np.flatnonzero(is_near[:-1])
+        else:
+            changed = self._step_frontier()
+            # neighbors are symmetric, so the cells next to the changed ones are in their table columns
+            near = np.concatenate((changed, self._neighbors[:, changed].ravel()))
+            # duplicates are dropped without sorting, only the last stamp of an ID stays equal to its position
+            positions = np.arange(len(near))
+            self._stamps[near] = positions
+            near = near[self._stamps[near] == positions]
+            self._frontier = near[near != len(self._keys)]
+        return len(changed)
+
+    def _step_frontier(self) -> np.ndarray:
+        frontier, states = self._frontier, self._states
+        keys = states[frontier].astype(np.intp) * (len(self.neighborhood.offsets) + 1)
+        for neighbors in self._neighbors:
+            keys += states[neighbors[frontier]]
+        changed = frontier[self._transitions[keys] != states[frontier]]
+        states[changed] ^= 1
+        return changed
+
+    def _step_all(self) -> int:
+        count_of_cells = len(self._keys)
+        states, keys = self._states[:count_of_cells], self._keys
+        np.multiply(states, len(self.neighborhood.offsets) + 1, out=keys)
+        for neighbors in self._neighbors:
+            np.take(self._states, neighbors, out=self._gathered)
+            np.add(keys, self._gathered, out=keys)
+
+        next_states = self._next_states[:count_of_cells]
+        np.take(self._transitions, keys, out=next_states)
+        np.not_equal(next_states, states, out=self._is_changed)
+        self._states, self._next_states = self._next_states, self._states
+        return int(np.count_nonzero(self._is_changed))
+
+    def count_of_active(self) -> int:
+        return int(np.count_nonzero(self._states[:-1]))
+
+    def get_active(self) -> Set[TCoords]:
+        indices = np.argwhere(self.cells)[self._states[:-1].astype(bool)]
+        return {tuple(int(x) for x in coords) for coords in indices}
+
+
+class SparseAutomaton(Automaton):
+    """ Set of active cells on an unbounded space, for patterns much smaller than their bounding box """
+
+    def __init__(self, active: Iterable[TCoords], neighborhood: Neighborhood, rule: Rule):
+        super().__init__(neighborhood, rule)
+        if neighborhood.line_of_sight:
+            raise ValueError('line of sight needs a dense automaton')
+        if 0 in rule.born:
+            raise ValueError('cells born without neighbors would fill the unbounded space')
+        self.active = set(active)  # type: Set[TCoords]
+
+    def _step(self) -> int:
+        neighbors = Counter()
+        for coords in self.active:
+            for offset in self.neighborhood.offsets:
+                neighbors[tuple(x + y for x, y in zip(coords, offset))] += 1
+
+        active = {coords for coords, count in neighbors.items() if count in self.rule.born and coords not in self.active}
+        active.update(coords for coords in self.active if neighbors[coords] in self.rule.survive)
+        changed = len(active ^ self.active)
+        self.active = active
+        return changed
+
+    def count_of_active(self) -> int:
+        return len(self.active)
+
+    def get_active(self) -> Set[TCoords]:
+        return set(self.active)
@@ -0,0 +1,193 @@
+import argparse
+import json
+import math
+import os
+import resource
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from aoc import generators
+from aoc.runner import print_table
+from aoc.tasks import PARTS, ROOT_DIR, JobInfo, TaskInfo, discover_tasks, get_jobs, get_solver, run_job, select_tasks
+
+DEFAULT_BASELINE = os.path.join(ROOT_DIR, 'bench_baseline.json')
+DEFAULT_GENERATED_DIR = os.path.join(ROOT_DIR, '.cache', 'generated')
+
+
+class BenchResult(NamedTuple):
+    name: str
+    repeats: int
+    min: float
+    median: float
+    p95: float
+    max_rss_kb: int
+
+    def to_json(self) -> Dict:
+        return {
+            'repeats': self.repeats,
+            'min': self.min,
+            'median': self.median,
+            'p95': self.p95,
+            'max_rss_kb': self.max_rss_kb
+        }
+
+    @staticmethod
+    def from_json(name: str, data: Dict) -> 'BenchResult':
+        return BenchResult(name=name, **data)
+
+
+class Regression(NamedTuple):
+    name: str
+    metric: str
+    baseline: float
+    actual: float
+
+    @property
+    def ratio(self) -> float:
+        return self.actual / self.baseline if self.baseline else math.inf
+
+
+def _percentile(values: Sequence[float], percent: int) -> float:
+    ordered = sorted(values)
+    rank = math.ceil(percent / 100 * len(ordered))
+    return ordered[max(rank, 1) - 1]
+
+
+def _get_max_rss_kb() -> int:
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # linux reports kilobytes, macOS reports bytes
+    return max_rss // 1024 if sys.platform == 'darwin' else max_rss
+
+
+def measure_job(job: JobInfo, repeats: int) -> BenchResult:
+    get_solver(job.task, job.part)  # keep the module import out of the first timing
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        run_job(job)
+        timings.append(time.perf_counter() - started)
+    return BenchResult(
+        name=job.name,
+        repeats=repeats,
+        min=min(timings),
+        median=statistics.median(timings),
+        p95=_percentile(timings, 95),
+        max_rss_kb=_get_max_rss_kb()
+    )
+
+
+def get_scaling_jobs(tasks: Sequence[TaskInfo], sizes: Sequence[int], directory: str, seed: int) -> List[JobInfo]:
+    jobs = []
+    for task in tasks:
+        if task.name not in generators.GENERATORS:
+            continue
+        task_dir = os.path.join(directory, task.name)
+        os.makedirs(task_dir, exist_ok=True)
+        for size in sizes:
+            path = os.path.join(task_dir, f'generated_{size}_{seed}.txt')
+            if not os.path.exists(path):
+                generators.write_input(path, task.name, size, seed)
+            jobs.extend(JobInfo(task=task, part=part, path=path) for part in PARTS if get_solver(task, part))
+    return jobs
+
+
+def run_benchmarks(jobs: Sequence[JobInfo], repeats: int, workers: int) -> List[BenchResult]:
+    results = []
+    # fresh process per job keeps the peak RSS of one job apart from the others
+    with ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1) as executor:
+        futures = [executor.submit(measure_job, job, repeats) for job in jobs]
+        for future in futures:
+            result = future.result()
+            print(f'{result.median:9.3f}s {result.max_rss_kb:>9}kb  {result.name}', flush=True)
+            results.append(result)
+    return results
+
+
+def load_baseline(path: str) -> Dict[str, BenchResult]:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as fp:
+        data = json.load(fp)
+    return {name: BenchResult.from_json(name, values) for name, values in data.items()}
+
+
+def save_baseline(path: str, results: Sequence[BenchResult]) -> None:
+    data = load_baseline(path)
+    data.update((result.name, result) for result in results)
+    with open(path, 'w') as fp:
+        json.dump({name: data[name].to_json() for name in sorted(data)}, fp, indent=2)
+        fp.write('\n')
+
+
+def find_regressions(baseline: Dict[str, BenchResult], results: Sequence[BenchResult],
+                     threshold: float, min_time: float) -> List[Regression]:
+    regressions = []
+    for result in results:
+        expected = baseline.get(result.name)
+        if not expected:
+            continue
+        if result.median > min_time and result.median > expected.median * (1 + threshold):
+            regressions.append(Regression(result.name, 'median', expected.median, result.median))
+        if result.max_rss_kb > expected.max_rss_kb * (1 + threshold):
+            regressions.append(Regression(result.name, 'max_rss_kb', expected.max_rss_kb, result.max_rss_kb))
+    return regressions
+
+
+def print_results(baseline: Dict[str, BenchResult], results: Sequence[BenchResult]) -> None:
+    rows = [('job', 'min, s', 'median, s', 'p95, s', 'rss, kb', 'vs baseline')]
+    for result in results:
+        expected = baseline.get(result.name)
+        change = f'{result.median / expected.median:.2f}x' if expected and expected.median else '-'
+        rows.append((
+            result.name, f'{result.min:.4f}', f'{result.median:.4f}', f'{result.p95:.4f}',
+            str(result.max_rss_kb), change
+        ))
+    print_table(rows)
+
+
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m aoc.bench', description='Benchmark puzzle solvers.')
+    parser.add_argument('patterns', nargs='*', help='tasks to measure, e.g. 2020 or 2020/task_1* (default: all)')
+    parser.add_argument('-n', '--repeats', type=int, default=5, help='runs of every job')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='count of worker processes')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='JSON file with baseline timings')
+    parser.add_argument('--save', action='store_true', help='store results as the new baseline')
+    parser.add_argument('--threshold', type=float, default=0.2, help='allowed relative slowdown, 0.2 is 20%%')
+    parser.add_argument('--min-time', type=float, default=0.01, help='ignore slowdowns of faster jobs, s')
+    parser.add_argument('--sizes', type=lambda x: [int(size) for size in x.split(',')],
+                        help='measure generated inputs of these sizes instead of the puzzle ones, e.g. 1000,10000')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the generated inputs')
+    parser.add_argument('--generated-dir', default=DEFAULT_GENERATED_DIR, help='directory of the generated inputs')
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(argv)
+    tasks = select_tasks(discover_tasks(), args.patterns)
+    if args.sizes:
+        jobs = get_scaling_jobs(tasks, args.sizes, args.generated_dir, args.seed)
+    else:
+        jobs = get_jobs(tasks)
+    print('measure', len(jobs), 'jobs,', args.repeats, 'repeats each')
+
+    baseline = load_baseline(args.baseline)
+    results = run_benchmarks(jobs, args.repeats, args.jobs)
+    print_results(baseline, results)
+
+    if args.save:
+        save_baseline(args.baseline, results)
+        print('\nbaseline saved to', args.baseline)
+        return 0
+
+    regressions = find_regressions(baseline, results, args.threshold, args.min_time)
+    for regression in regressions:
+        print(f'REGRESSION {regression.name} {regression.metric}: '
+              f'{regression.baseline} -> {regression.actual} ({regression.ratio:.2f}x)')
+    return int(bool(regressions))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,172 @@
+from collections import deque
+from typing import Callable, Deque, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+ACC = 0
+JMP = 1
+NOP = 2
+
+NAMES = ('acc', 'jmp', 'nop')
+_OPCODES_by_NAMES = {name: opcode for opcode, name in enumerate(NAMES)}
+
+
+class Program(NamedTuple):
+    opcodes: bytearray
+    args: List[int]
+
+    @staticmethod
+    def from_lines(lines: Iterable[str]) -> 'Program':
+        program = Program(bytearray(), [])
+        for line in lines:
+            if line:
+                name, arg = line.split(' ')
+                program.opcodes.append(_OPCODES_by_NAMES[name])
+                program.args.append(int(arg))
+        return program
+
+    def __len__(self) -> int:
+        return len(self.opcodes)
+
+    def get_next(self, index: int, is_swapped: bool = False) -> int:
+        """ Address after the command, with jmp and nop swapped on request """
+        opcode = self.opcodes[index]
+        if is_swapped and opcode != ACC:
+            opcode = NOP if opcode == JMP else JMP
+        return index + self.args[index] if opcode == JMP else index + 1
+
+    def to_text(self, index: int) -> str:
+        return f'{NAMES[self.opcodes[index]]} {self.args[index]:+d}'
+
+
+class Snapshot(NamedTuple):
+    accumulator: int
+    index: int
+    visited: bytes
+
+
+# a hook is called before every executed command, the address of the command is machine.index
+THook = Callable[['Machine'], None]
+
+
+class Machine:
+    """ Runs a program until it ends or comes back to a visited command """
+
+    def __init__(self, program: Program, hooks: Sequence[THook] = (), accumulator: int = 0, index: int = 0):
+        self.program = program
+        self.hooks = list(hooks)
+        self.accumulator = accumulator
+        self.index = index
+        self.visited = bytearray(len(program))
+        self.count_of_steps = 0
+
+    @property
+    def is_terminated(self) -> bool:
+        return self.index >= len(self.program)
+
+    @property
+    def is_looped(self) -> bool:
+        return 0 <= self.index < len(self.program) and self.visited[self.index]
+
+    def snapshot(self) -> Snapshot:
+        return Snapshot(self.accumulator, self.index, bytes(self.visited))
+
+    def restore(self, snapshot: Snapshot):
+        self.accumulator = snapshot.accumulator
+        self.index = snapshot.index
+        self.visited[:] = snapshot.visited
+
+    def run(self, stop_on_loop: bool = True, max_steps: Optional[int] = None) -> bool:
+        """ Returns True when the program has reached its end """
+        if not self.hooks and stop_on_loop and max_steps is None:
+            self._run_fast()
+        else:
+            self._run_traced(stop_on_loop, max_steps)
+        return self.is_terminated
+
+    def _run_fast(self):
+        opcodes, args, visited = self.program.opcodes, self.program.args, self.visited
+        count_of_commands = len(opcodes)
+        index, accumulator, count_of_steps = self.index, self.accumulator, self.count_of_steps
+
+        while 0 <= index < count_of_commands and not visited[index]:
+            visited[index] = True
+            count_of_steps += 1
+            opcode = opcodes[index]
+            if opcode == ACC:
+                accumulator += args[index]
+                index += 1
+            elif opcode == JMP:
+                index += args[index]
+            else:
+                index += 1
+
+        self.index, self.accumulator, self.count_of_steps = index, accumulator, count_of_steps
+
+    def _run_traced(self, stop_on_loop: bool, max_steps: Optional[int]):
+        opcodes, args, visited = self.program.opcodes, self.program.args, self.visited
+        count_of_commands = len(opcodes)
+        last_step = None if max_steps is None else self.count_of_steps + max_steps
+
+        while 0 <= self.index < count_of_commands and self.count_of_steps != last_step:
+            index = self.index
+            if stop_on_loop and visited[index]:
+                break
+            for hook in self.hooks:
+                hook(self)
+            visited[index] = True
+            self.count_of_steps += 1
+            opcode = opcodes[index]
+            if opcode == ACC:
+                self.accumulator += args[index]
+                self.index = index + 1
+            elif opcode == JMP:
+                self.index = index + args[index]
+            else:
+                self.index = index + 1
+
+    def get_loop(self) -> List[int]:
+        """ Addresses of the loop the machine has stopped on, empty while it is not looped """
+        if not self.is_looped:
+            return []
+        loop = [self.index]
+        index = self.program.get_next(self.index)
+        while index != self.index and len(loop) <= len(self.program):
+            loop.append(index)
+            index = self.program.get_next(index)
+        return loop
+
+
+class Loop(NamedTuple):
+    start: int
+    end: int
+    count_of_turns: int
+
+
+class HitCounter:
+    """ Hook which counts executions of every command """
+
+    def __init__(self, program: Program):
+        self.program = program
+        self.hits = [0] * len(program)
+
+    def __call__(self, machine: Machine):
+        self.hits[machine.index] += 1
+
+    def get_hot_loops(self, top: Optional[int] = None) -> List[Loop]:
+        """ Backward jumps by the count of times they have been taken, the most taken first """
+        loops = [
+            Loop(start=index + arg, end=index, count_of_turns=hits)
+            for index, (opcode, arg, hits) in enumerate(zip(self.program.opcodes, self.program.args, self.hits))
+            if opcode == JMP and arg <= 0 and hits
+        ]
+        loops.sort(key=lambda x: (-x.count_of_turns, x.end))
+        return loops[:top]
+
+
+class Tracer:
+    """ Hook which keeps the last executed commands with the accumulator before them """
+
+    def __init__(self, limit: int = 100):
+        self.records = deque(maxlen=limit)  # type: Deque[Tuple[int, str, int]]
+
+    def __call__(self, machine: Machine):
+        self.records.append((machine.index, machine.program.to_text(machine.index), machine.accumulator))
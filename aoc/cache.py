@@ -0,0 +1,109 @@
+import contextlib
+import glob
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+from types import ModuleType
+from typing import Any, Iterable, NamedTuple, Optional, Set
+
+from aoc.tasks import ROOT_DIR, JobInfo, load_module
+
+DEFAULT_DIR = os.path.join(ROOT_DIR, '.cache', 'answers')
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+class CachedAnswer(NamedTuple):
+    answer: Any
+    elapsed: float
+
+
+def _hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as fp:
+        for chunk in iter(lambda: fp.read(_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _is_local(module: ModuleType) -> bool:
+    path = getattr(module, '__file__', None)
+    return bool(path) and os.path.abspath(path).startswith(ROOT_DIR + os.sep)
+
+
+def _iter_local_modules(module: ModuleType, visited: Set[str]) -> Iterable[ModuleType]:
+    if module.__name__ in visited or not _is_local(module):
+        return
+    visited.add(module.__name__)
+    yield module
+    for value in vars(module).values():
+        imported = value if isinstance(value, ModuleType) else inspect.getmodule(value)
+        if imported is not None:
+            yield from _iter_local_modules(imported, visited)
+
+
+def hash_sources(module: ModuleType) -> str:
+    """ Hash of the task module and of every module of the repository it depends on """
+    digest = hashlib.sha256()
+    modules = sorted(_iter_local_modules(module, set()), key=lambda x: x.__name__)
+    for item in modules:
+        digest.update(item.__name__.encode())
+        digest.update(_hash_file(item.__file__).encode())
+    return digest.hexdigest()
+
+
+class AnswerCache:
+    def __init__(self, directory: str = DEFAULT_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def get_key(job: JobInfo) -> str:
+        parts = (job.task.name, str(job.part), _hash_file(job.path), hash_sources(load_module(job.task)))
+        return hashlib.sha256('|'.join(parts).encode()).hexdigest()
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}.json')
+
+    def get(self, key: str) -> Optional[CachedAnswer]:
+        path = self._get_path(key)
+        try:
+            with open(path) as fp:
+                data = json.load(fp)
+        except (OSError, ValueError):
+            return None
+        with contextlib.suppress(OSError):
+            # modification time is the last usage for the LRU eviction
+            os.utime(path)
+        return CachedAnswer(**data)
+
+    def put(self, key: str, value: CachedAnswer) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(handle, 'w') as fp:
+            json.dump(value._asdict(), fp)
+        os.replace(temp_path, self._get_path(key))
+        self.evict()
+
+    def evict(self) -> None:
+        entries = []
+        for path in glob.glob(os.path.join(self.directory, '*.json')):
+            with contextlib.suppress(OSError):
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            with contextlib.suppress(OSError):
+                os.remove(path)
+            total -= size
+
+    def clear(self) -> None:
+        for path in glob.glob(os.path.join(self.directory, '*.json')):
+            with contextlib.suppress(OSError):
+                os.remove(path)
@@ -0,0 +1,570 @@
+import argparse
+import itertools
+import random
+import string
+import sys
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+
+TGenerator = Callable[[random.Random, int], Iterator[str]]
+
+GENERATORS = {}  # type: Dict[str, TGenerator]
+
+
+def _register(task_name: str) -> Callable[[TGenerator], TGenerator]:
+    def decorator(generator: TGenerator) -> TGenerator:
+        GENERATORS[task_name] = generator
+        return generator
+
+    return decorator
+
+
+def _make_word(index: int, length: int = 4) -> str:
+    chars = []
+    for _ in range(length):
+        index, digit = divmod(index, len(string.ascii_lowercase))
+        chars.append(string.ascii_lowercase[digit])
+    return ''.join(reversed(chars))
+
+
+def _plant_expenses(rng: random.Random) -> List[int]:
+    while True:
+        first = rng.randint(1, 2019)
+        low, high = sorted(rng.sample(range(1, 2020), 2))
+        planted = [first, 2020 - first, low, high - low, 2020 - high]
+        pairs = [x for x in itertools.combinations(planted, 2) if sum(x) == 2020]
+        triples = [x for x in itertools.combinations(planted, 3) if sum(x) == 2020]
+        if len(pairs) == 1 and len(triples) == 1:
+            return planted
+
+
+@_register('2020/task_01')
+def _generate_expense_report(rng: random.Random, size: int) -> Iterator[str]:
+    # every filler is above the target, so only the planted pair and triple sum up to 2020
+    numbers = [rng.randint(2021, 1000000) for _ in range(max(size - 5, 0))] + _plant_expenses(rng)
+    rng.shuffle(numbers)
+    for number in numbers:
+        yield str(number)
+
+
+@_register('2020/task_02')
+def _generate_passwords(rng: random.Random, size: int) -> Iterator[str]:
+    for _ in range(size):
+        length = rng.randint(3, 20)
+        low = rng.randint(1, length)
+        high = rng.randint(low, length)
+        char = rng.choice('abcdefghij')
+        text = ''.join(rng.choice('abcdefghij') for _ in range(length))
+        yield f'{low}-{high} {char}: {text}'
+
+
+@_register('2020/task_03')
+def _generate_trees_map(rng: random.Random, size: int) -> Iterator[str]:
+    for _ in range(size):
+        yield ''.join('#' if rng.random() < 0.2 else '.' for _ in range(31))
+
+
+def _generate_passport(rng: random.Random) -> Dict[str, str]:
+    fields = {
+        'byr': str(rng.randint(1900, 2010)),
+        'iyr': str(rng.randint(2005, 2025)),
+        'eyr': str(rng.randint(2015, 2035)),
+        'hgt': rng.choice((f'{rng.randint(140, 200)}cm', f'{rng.randint(50, 80)}in', str(rng.randint(50, 200)))),
+        'hcl': rng.choice(('#', '')) + ''.join(rng.choice('0123456789abcdefz') for _ in range(6)),
+        'ecl': rng.choice(('amb', 'blu', 'brn', 'gry', 'grn', 'hzl', 'oth', 'xry')),
+        'pid': ''.join(rng.choice(string.digits) for _ in range(rng.choice((9, 9, 9, 10)))),
+        'cid': str(rng.randint(10, 350)),
+    }
+    for name in rng.sample(sorted(fields), rng.choice((0, 0, 0, 1, 2))):
+        del fields[name]
+    return fields
+
+
+@_register('2020/task_04')
+def _generate_passports(rng: random.Random, size: int) -> Iterator[str]:
+    for index in range(size):
+        if index:
+            yield ''
+        fields = [f'{name}:{value}' for name, value in _generate_passport(rng).items()]
+        rng.shuffle(fields)
+        cut = rng.randint(1, len(fields))
+        yield ' '.join(fields[:cut])
+        if fields[cut:]:
+            yield ' '.join(fields[cut:])
+
+
+@_register('2020/task_05')
+def _generate_boarding_passes(rng: random.Random, size: int) -> Iterator[str]:
+    # taken seats are a span of IDs without one inside, an ID is the row * 8 + the column
+    count = min(max(size, 2), 1022)
+    low = rng.randint(0, 1023 - count)
+    seat_ids = list(range(low, low + count + 1))
+    del seat_ids[rng.randint(1, count - 1)]
+    rng.shuffle(seat_ids)
+    for seat_id in seat_ids:
+        row, col = divmod(seat_id, 8)
+        yield f'{row:07b}'.replace('0', 'F').replace('1', 'B') + f'{col:03b}'.replace('0', 'L').replace('1', 'R')
+
+
+@_register('2020/task_06')
+def _generate_customs_answers(rng: random.Random, size: int) -> Iterator[str]:
+    for index in range(size):
+        if index:
+            yield ''
+        for _ in range(rng.randint(1, 5)):
+            yield ''.join(rng.sample(string.ascii_lowercase, rng.randint(1, 26)))
+
+
+@_register('2020/task_07')
+def _generate_bags_rules(rng: random.Random, size: int) -> Iterator[str]:
+    # bags contain only bags of higher index, which keeps the rules acyclic
+    colors = [f'{_make_word(index)} {_make_word(index * 7 + 3)}' for index in range(max(size, 2))]
+    colors[len(colors) // 2] = 'shiny gold'
+    lines = []
+    for index, color in enumerate(colors):
+        count = min(rng.choice((0, 0, 1, 2, 3)), len(colors) - index - 1)
+        inner = rng.sample(range(index + 1, min(index + 50, len(colors))), count) if count else []
+        if not inner:
+            lines.append(f'{color} bags contain no other bags')
+            continue
+        parts = []
+        for inner_index in inner:
+            amount = rng.randint(1, 3)
+            parts.append(f'{amount} {colors[inner_index]} {"bag" if amount == 1 else "bags"}')
+        lines.append(f'{color} bags contain {", ".join(parts)}')
+    rng.shuffle(lines)
+    yield from lines
+
+
+@_register('2020/task_08')
+def _generate_bootcode(rng: random.Random, size: int) -> Iterator[str]:
+    # straight program, skipped regions are 'jmp +0' traps so that only
+    # the planted backward jump can be swapped to make it terminate
+    program = []
+    executed = []
+    while len(program) < size - 1:
+        kind = rng.choices(('acc', 'nop', 'jmp'), weights=(5, 2, 1))[0]
+        executed.append(len(program))
+        if kind == 'acc':
+            program.append(f'acc {rng.randint(-50, 50):+}')
+        elif kind == 'nop':
+            program.append('nop +0')
+        else:
+            skipped = rng.randint(1, 3)
+            program.append(f'jmp {skipped + 1:+}')
+            program.extend('jmp +0' for _ in range(skipped))
+
+    position = rng.randint(len(executed) // 2, len(executed) - 1) if executed else 0
+    target = rng.choice(executed[:position + 1]) if executed else 0
+    corrupted = executed[position] if executed else 0
+    program.insert(corrupted, f'jmp {target - corrupted:+}')
+    yield from program
+
+
+@_register('2020/task_09')
+def _generate_xmas(rng: random.Random, size: int, window: int = 25) -> Iterator[str]:
+    # every number is a pair sum of the window, so values double about every window length
+    preamble = rng.sample(range(1, 100), window)
+    yield from map(str, preamble)
+
+    recent = list(preamble)
+    for index in range(max(size - window - 1, 8 * window)):
+        first, second = rng.sample(recent, 2)
+        recent[index % window] = first + second
+        yield str(first + second)
+
+    # a short range of the preamble is far below any pair sum of the last window
+    pairs_sums = set(map(sum, itertools.combinations(recent, 2)))
+    while True:
+        low = rng.randint(0, window - 5)
+        invalid = sum(preamble[low:rng.randint(low + 2, low + 4)])
+        if invalid not in pairs_sums:
+            yield str(invalid)
+            return
+
+
+@_register('2020/task_10')
+def _generate_adapters(rng: random.Random, size: int) -> Iterator[str]:
+    adapters = []
+    joltage = 0
+    for _ in range(size):
+        joltage += rng.choice((1, 1, 1, 2, 3, 3))
+        adapters.append(joltage)
+    rng.shuffle(adapters)
+    for joltage in adapters:
+        yield str(joltage)
+
+
+@_register('2020/task_11')
+def _generate_seat_layout(rng: random.Random, size: int) -> Iterator[str]:
+    # square layout of about size seats
+    side = max(int(size ** 0.5), 2)
+    for _ in range(side):
+        yield ''.join('L' if rng.random() < 0.75 else '.' for _ in range(side))
+
+
+@_register('2020/task_12')
+def _generate_navigation(rng: random.Random, size: int) -> Iterator[str]:
+    for _ in range(size):
+        action = rng.choice('NSEWLRF')
+        value = rng.choice((90, 180, 270)) if action in 'LR' else rng.randint(1, 100)
+        yield f'{action}{value}'
+
+
+def _iter_primes() -> Iterator[int]:
+    found = []
+    candidate = 2
+    while True:
+        if all(candidate % prime for prime in found if prime * prime <= candidate):
+            found.append(candidate)
+            yield candidate
+        candidate += 1
+
+
+@_register('2020/task_13')
+def _generate_buses(rng: random.Random, size: int) -> Iterator[str]:
+    primes = _iter_primes()
+    buses = [str(next(primes)) for _ in range(max(size, 1))]
+    schedule = []
+    for bus_id in buses[::-1]:
+        schedule.append(bus_id)
+        schedule.extend('x' for _ in range(rng.randint(0, 3)))
+    yield str(rng.randint(1000, 1000000))
+    yield ','.join(schedule)
+
+
+@_register('2020/task_14')
+def _generate_docking_program(rng: random.Random, size: int) -> Iterator[str]:
+    # a few floating bits in every mask, as in the puzzle, so that the second part writes up to 512 addresses
+    count = 0
+    while count < size:
+        floating = set(rng.sample(range(36), rng.randint(0, 9)))
+        yield 'mask = ' + ''.join('X' if bit in floating else rng.choice('01') for bit in range(36))
+        for _ in range(min(rng.randint(1, 6), size - count)):
+            yield f'mem[{rng.randint(0, 65535)}] = {rng.randint(0, 1 << 30)}'
+            count += 1
+
+
+@_register('2020/task_15')
+def _generate_starting_numbers(rng: random.Random, size: int) -> Iterator[str]:
+    # the 2020th number has to be spoken in the game, not read from the input
+    count = min(max(size, 1), 2019)
+    yield ','.join(str(x) for x in rng.sample(range(2 * count + 10), count))
+
+
+_TICKET_FIELDS = (
+    'departure location', 'departure station', 'departure platform', 'departure track', 'departure date',
+    'departure time', 'arrival location', 'arrival station', 'arrival platform', 'arrival track', 'class',
+    'duration', 'price', 'route', 'row', 'seat', 'train', 'type', 'wagon', 'zone'
+)
+
+
+@_register('2020/task_16')
+def _generate_tickets(rng: random.Random, size: int, band: int = 40) -> Iterator[str]:
+    # a field accepts its own band of values and all bands after it, so the column of
+    # the k-th field fits exactly k + 1 fields and the order resolves one by one
+    count = len(_TICKET_FIELDS)
+    high = 100 + count * band - 1
+    for index, name in enumerate(_TICKET_FIELDS):
+        yield f'{name}: {100 + index * band}-{high} or {index + 1}-60'
+
+    order = list(range(count))
+    rng.shuffle(order)
+
+    def _make_ticket() -> List[int]:
+        return [rng.randint(100 + index * band, 100 + (index + 1) * band - 1) for index in order]
+
+    yield ''
+    yield 'your ticket:'
+    yield ','.join(map(str, _make_ticket()))
+    yield ''
+    yield 'nearby tickets:'
+    for index in range(max(size, 1)):
+        values = _make_ticket()
+        # values between the ranges and above all of them are invalid for any field
+        if index and rng.random() < 0.25:
+            values[rng.randrange(count)] = rng.choice((rng.randint(61, 99), rng.randint(high + 1, 999)))
+        yield ','.join(map(str, values))
+
+
+@_register('2020/task_17')
+def _generate_cubes(rng: random.Random, size: int) -> Iterator[str]:
+    # square slice of about size cubes
+    side = max(int(size ** 0.5), 1)
+    for _ in range(side):
+        yield ''.join('#' if rng.random() < 0.4 else '.' for _ in range(side))
+
+
+def _make_expression(rng: random.Random, depth: int) -> str:
+    parts = []
+    for index in range(rng.randint(2, 5)):
+        if index:
+            parts.append(rng.choice('+*'))
+        if depth and rng.random() < 0.3:
+            parts.append(f'({_make_expression(rng, depth - 1)})')
+        else:
+            parts.append(str(rng.randint(1, 9)))
+    return ' '.join(parts)
+
+
+@_register('2020/task_18')
+def _generate_expressions(rng: random.Random, size: int) -> Iterator[str]:
+    for _ in range(size):
+        yield _make_expression(rng, depth=3)
+
+
+class _RulesBuilder:
+    """ Rules of a trie for every set of words, equal subtrees share a rule """
+
+    def __init__(self, numbers: Iterator[int]):
+        self._numbers = numbers
+        self._chars = {'a': next(numbers), 'b': next(numbers)}
+        self._found = {}  # type: Dict[frozenset, str]
+        self.lines = [f'{number}: "{char}"' for char, number in self._chars.items()]
+
+    def add(self, words: frozenset, number: Optional[int] = None) -> str:
+        if number is None and words in self._found:
+            return self._found[words]
+        if len(words) == 1 and len(next(iter(words))) == 1:
+            return str(self._chars[next(iter(words))])
+        variants = []
+        for char in sorted({word[0] for word in words}):
+            tails = frozenset(word[1:] for word in words if word[0] == char)
+            variants.append(f'{self._chars[char]} {self.add(tails)}' if all(tails) else str(self._chars[char]))
+        number = next(self._numbers) if number is None else number
+        self._found.setdefault(words, str(number))
+        self.lines.append(f'{number}: {" | ".join(variants)}')
+        return str(number)
+
+
+@_register('2020/task_19')
+def _generate_messages(rng: random.Random, size: int, length: int = 5) -> Iterator[str]:
+    # rules 42 and 31 split the words of the length, as in the puzzle the rule 0 is 8 11,
+    # so messages are 42 42 31 in the first part and 42{m} 31{n}, m > n after the loops
+    words = [''.join(chars) for chars in itertools.product('ab', repeat=length)]
+    rng.shuffle(words)
+    firsts, seconds = words[:len(words) // 2], words[len(words) // 2:]
+    numbers = [x for x in range(1, 10 * len(words)) if x not in (8, 11, 31, 42)]
+    rng.shuffle(numbers)
+    builder = _RulesBuilder(iter(numbers))
+    builder.add(frozenset(firsts), 42)
+    builder.add(frozenset(seconds), 31)
+    lines = builder.lines + ['0: 8 11', '8: 42', '11: 42 31']
+    rng.shuffle(lines)
+    yield from lines
+
+    yield ''
+    for _ in range(size):
+        kind = rng.randrange(3)
+        if kind == 0:
+            parts = [rng.choice(firsts), rng.choice(firsts), rng.choice(seconds)]
+        elif kind == 1:
+            count_of_seconds = rng.randint(1, 3)
+            parts = [rng.choice(firsts) for _ in range(count_of_seconds + rng.randint(1, 3))]
+            parts.extend(rng.choice(seconds) for _ in range(count_of_seconds))
+        else:
+            parts = [rng.choice(words) for _ in range(rng.randint(2, 6))]
+        yield ''.join(parts)
+
+
+def _transform_tile(rng: random.Random, rows: List[str]) -> List[str]:
+    for _ in range(rng.randint(0, 3)):
+        rows = [''.join(row[col] for row in rows[::-1]) for col in range(len(rows))]
+    return rows[::-1] if rng.random() < 0.5 else rows
+
+
+@_register('2020/task_20')
+def _generate_tiles(rng: random.Random, size: int) -> Iterator[str]:
+    # neighbour tiles share a border of one random image, borders are long enough
+    # for a chance collision of any two of them (with flips) to be unlikely
+    count = max(int(size ** 0.5), 2)
+    tile_size = max(10, 2 * (count * count * 8).bit_length() + 10)
+    step = tile_size - 1
+    image = [''.join(rng.choice('#.') for _ in range(count * step + 1)) for _ in range(count * step + 1)]
+    codes = rng.sample(range(1000, 10000 + count * count * 10), count * count)
+    for index, code in enumerate(codes):
+        row, col = divmod(index, count)
+        rows = [line[col * step:col * step + tile_size] for line in image[row * step:row * step + tile_size]]
+        if index:
+            yield ''
+        yield f'Tile {code}:'
+        yield from _transform_tile(rng, rows)
+
+
+_ALLERGENS = ('dairy', 'eggs', 'fish', 'nuts', 'peanuts', 'sesame', 'shellfish', 'soy', 'wheat')
+
+
+@_register('2020/task_21')
+def _generate_foods(rng: random.Random, size: int) -> Iterator[str]:
+    # every allergen is listed by two foods with disjoint safe ingredients, so the
+    # intersection of the foods which list it leaves its own ingredient only
+    allergens = _ALLERGENS[:min(max(size // 4, 1), len(_ALLERGENS))]
+    names = [_make_word(index * 31 + 7) for index in range(max(size, 20) + len(allergens))]
+    rng.shuffle(names)
+    dangerous = dict(zip(allergens, names))
+    safe = names[len(allergens):]
+
+    foods = []
+    for allergen in allergens:
+        fillers = rng.sample(safe, 10)
+        foods.append(([dangerous[allergen]] + fillers[:5], [allergen]))
+        foods.append(([dangerous[allergen]] + fillers[5:], [allergen]))
+    while len(foods) < size:
+        listed = rng.sample(allergens, rng.randint(1, min(3, len(allergens))))
+        # a food may contain allergens which are not listed
+        contained = [name for allergen, name in dangerous.items() if allergen in listed or rng.random() < 0.2]
+        foods.append((contained + rng.sample(safe, rng.randint(3, 15)), listed))
+
+    rng.shuffle(foods)
+    for ingredients, listed in foods:
+        rng.shuffle(ingredients)
+        yield f'{" ".join(ingredients)} (contains {", ".join(sorted(listed))})'
+
+
+@_register('2020/task_22')
+def _generate_decks(rng: random.Random, size: int) -> Iterator[str]:
+    # sub-games of the second part grow out of reach past the 50 cards of the puzzle deal
+    count = min(max(size // 2, 1), 25)
+    cards = list(range(1, 2 * count + 1))
+    rng.shuffle(cards)
+    for player_id in (1, 2):
+        if player_id > 1:
+            yield ''
+        yield f'Player {player_id}:'
+        yield from map(str, cards[(player_id - 1) * count:player_id * count])
+
+
+@_register('2020/task_23')
+def _generate_cups(rng: random.Random, size: int) -> Iterator[str]:
+    # labels are single digits, so there are five to nine cups
+    labels = list(range(1, min(max(size, 5), 9) + 1))
+    rng.shuffle(labels)
+    yield ''.join(map(str, labels))
+
+
+@_register('2020/task_24')
+def _generate_hex_steps(rng: random.Random, size: int) -> Iterator[str]:
+    for _ in range(size):
+        yield ''.join(rng.choice(('e', 'se', 'sw', 'w', 'nw', 'ne')) for _ in range(rng.randint(1, 20)))
+
+
+@_register('2020/task_25')
+def _generate_public_keys(rng: random.Random, size: int) -> Iterator[str]:
+    # size is the upper bound of the loop sizes, which the first part has to find
+    for _ in range(2):
+        yield str(pow(7, rng.randint(1, max(size, 1)), 20201227))
+
+
+@_register('2021/task_01')
+def _generate_depths(rng: random.Random, size: int) -> Iterator[str]:
+    depth = rng.randint(100, 200)
+    for _ in range(size):
+        depth = max(depth + rng.randint(-10, 20), 0)
+        yield str(depth)
+
+
+@_register('2021/task_02')
+def _generate_commands(rng: random.Random, size: int) -> Iterator[str]:
+    for _ in range(size):
+        # going down more often than up keeps the depth positive
+        yield f'{rng.choices(("forward", "down", "up"), weights=(3, 2, 1))[0]} {rng.randint(1, 9)}'
+
+
+@_register('2021/task_03')
+def _generate_diagnostic(rng: random.Random, size: int) -> Iterator[str]:
+    for value in rng.sample(range(1 << 20), min(size, 1 << 20)):
+        yield f'{value:020b}'
+
+
+@_register('2021/task_04')
+def _generate_bingo(rng: random.Random, size: int) -> Iterator[str]:
+    yield ','.join(str(x) for x in rng.sample(range(100), 100))
+    for _ in range(size):
+        yield ''
+        values = rng.sample(range(100), 25)
+        for row in range(5):
+            yield ' '.join(f'{x:2}' for x in values[row * 5:row * 5 + 5])
+
+
+@_register('2022/task_01')
+def _generate_calories(rng: random.Random, size: int) -> Iterator[str]:
+    for index in range(size):
+        if index:
+            yield ''
+        for _ in range(rng.randint(1, 10)):
+            yield str(rng.randint(1000, 10000))
+
+
+@_register('2022/task_02')
+def _generate_strategy(rng: random.Random, size: int) -> Iterator[str]:
+    for _ in range(size):
+        yield f'{rng.choice("ABC")} {rng.choice("XYZ")}'
+
+
+def _generate_rucksack(rng: random.Random, pool: List[str], badge: str) -> str:
+    items = pool + [badge]
+    rng.shuffle(items)
+    common = items.pop()
+    cut = rng.randint(1, len(items) - 1)
+    first = items[:cut] + [common]
+    second = items[cut:] + [common]
+    length = max(len(first), len(second)) + rng.randint(0, 5)
+    cell1 = first + [rng.choice(first) for _ in range(length - len(first))]
+    cell2 = second + [rng.choice(second) for _ in range(length - len(second))]
+    rng.shuffle(cell1)
+    rng.shuffle(cell2)
+    return ''.join(cell1 + cell2)
+
+
+@_register('2022/task_03')
+def _generate_rucksacks(rng: random.Random, size: int) -> Iterator[str]:
+    # elves of a group take items from disjoint pools, so the badge is the only shared item
+    letters = string.ascii_letters
+    for _ in range(max(size // 3, 1)):
+        badge = rng.choice(letters)
+        others = [x for x in letters if x != badge]
+        rng.shuffle(others)
+        for elf in range(3):
+            pool = others[elf * 17:(elf + 1) * 17]
+            yield _generate_rucksack(rng, rng.sample(pool, rng.randint(3, 16)), badge)
+
+
+@_register('2022/task_04')
+def _generate_sections(rng: random.Random, size: int) -> Iterator[str]:
+    for _ in range(size):
+        low1, high1 = sorted(rng.sample(range(1, 100), 2))
+        low2, high2 = sorted(rng.sample(range(1, 100), 2))
+        yield f'{low1}-{high1},{low2}-{high2}'
+
+
+def generate(task_name: str, size: int, seed: int = 0) -> Iterator[str]:
+    return GENERATORS[task_name](random.Random(seed), size)
+
+
+def write_input(path: str, task_name: str, size: int, seed: int = 0) -> None:
+    with open(path, 'w') as fp:
+        for line in generate(task_name, size, seed):
+            fp.write(line)
+            fp.write('\n')
+
+
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m aoc.generators', description='Generate synthetic inputs.')
+    parser.add_argument('task', choices=sorted(GENERATORS), help='task of the input format')
+    parser.add_argument('size', type=int, help='count of records (lines, groups, boards, ...)')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the random generator')
+    parser.add_argument('-o', '--output', help='file to write (default: stdout)')
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(argv)
+    if args.output:
+        write_input(args.output, args.task, args.size, args.seed)
+    else:
+        for line in generate(args.task, args.size, args.seed):
+            sys.stdout.write(line + '\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,176 @@
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from aoc import loader
+
+TOffsets = Sequence[Tuple[int, int]]
+
+MOORE_OFFSETS = tuple((row, col) for row in (-1, 0, 1) for col in (-1, 0, 1) if row or col)  # type: TOffsets
+
+
+def count_neighbors(mask: np.ndarray, offsets: Sequence[Tuple[int, ...]] = MOORE_OFFSETS) -> np.ndarray:
+    """ Count of set cells at the offsets of every cell in any dimensions, cells beyond the edges are unset """
+    margin = max(abs(step) for offset in offsets for step in offset)
+    dtype = np.min_scalar_type(len(offsets))
+    padded = np.pad(mask.astype(dtype), margin)
+    counts = np.zeros(mask.shape, dtype=dtype)
+    for offset in offsets:
+        counts += padded[tuple(slice(margin + step, margin + step + size) for step, size in zip(offset, mask.shape))]
+    return counts
+
+
+def _see_along(mask: np.ndarray, transparent: np.ndarray, v_step: int, h_step: int) -> np.ndarray:
+    if not v_step:
+        return _see_along(mask.T, transparent.T, h_step, v_step).T
+
+    height, width = mask.shape
+    seen = np.zeros(mask.shape, dtype=bool)
+    # a cell sees a set cell when the next one is set, or is transparent and sees it further
+    rows = range(height - 1 - v_step, -1, -1) if v_step > 0 else range(-v_step, height)
+    for row in rows:
+        ahead = row + v_step
+        line = mask[ahead] | (transparent[ahead] & seen[ahead])
+        if h_step > 0:
+            seen[row, :width - h_step] = line[h_step:]
+        elif h_step < 0:
+            seen[row, -h_step:] = line[:width + h_step]
+        else:
+            seen[row] = line
+    return seen
+
+
+def count_visible(mask: np.ndarray, transparent: np.ndarray, offsets: TOffsets = MOORE_OFFSETS) -> np.ndarray:
+    """ Count of directions in which the first non transparent cell is set """
+    counts = np.zeros(mask.shape, dtype=np.uint8)
+    for v_step, h_step in offsets:
+        counts += _see_along(mask, transparent, v_step, h_step)
+    return counts
+
+
+def _find_along(ids: np.ndarray, v_step: int, h_step: int, line_of_sight: bool) -> np.ndarray:
+    if not v_step:
+        return _find_along(ids.T, h_step, v_step, line_of_sight).T
+
+    height, width = ids.shape
+    found = np.full(ids.shape, -1, dtype=ids.dtype)
+    # a cell finds the next one, or what the next one finds when it is not a cell itself
+    rows = range(height - 1 - v_step, -1, -1) if v_step > 0 else range(-v_step, height)
+    for row in rows:
+        ahead = row + v_step
+        line = np.where(ids[ahead] >= 0, ids[ahead], found[ahead]) if line_of_sight else ids[ahead]
+        if h_step > 0:
+            found[row, :width - h_step] = line[h_step:]
+        elif h_step < 0:
+            found[row, -h_step:] = line[:width + h_step]
+        else:
+            found[row] = line
+    return found
+
+
+def build_neighbor_table(cells: np.ndarray, offsets: TOffsets = MOORE_OFFSETS, line_of_sight: bool = False) -> np.ndarray:
+    """ IDs of the neighbors of every cell by the offsets, cells are numbered in the row-major order """
+    count_of_cells = int(np.count_nonzero(cells))
+    ids = np.full(cells.shape, -1, dtype=np.intp)
+    ids[cells] = np.arange(count_of_cells)
+    table = np.empty((len(offsets), count_of_cells), dtype=np.intp)
+    for index, (v_step, h_step) in enumerate(offsets):
+        table[index] = _find_along(ids, v_step, h_step, line_of_sight)[cells]
+    # a missing neighbor is the ID right after the last cell
+    table[table < 0] = count_of_cells
+    return table
+
+
+def find_pattern(mask: np.ndarray, pattern: np.ndarray) -> np.ndarray:
+    """ Top left corners of the places where every set cell of the pattern is set in the mask """
+    height = max(mask.shape[0] - pattern.shape[0] + 1, 0)
+    width = max(mask.shape[1] - pattern.shape[1] + 1, 0)
+    found = np.ones((height, width), dtype=bool)
+    for row, col in zip(*np.nonzero(pattern)):
+        found &= mask[row:row + height, col:col + width]
+    return found
+
+
+def cover_pattern(mask: np.ndarray, pattern: np.ndarray) -> np.ndarray:
+    """ Cells of the mask which belong to any place found by find_pattern """
+    found = find_pattern(mask, pattern)
+    height, width = found.shape
+    covered = np.zeros(mask.shape, dtype=bool)
+    for row, col in zip(*np.nonzero(pattern)):
+        covered[row:row + height, col:col + width] |= found
+    return covered
+
+
+class Grid:
+    """ Rectangle of characters in a contiguous uint8 array, rotations and flips are views of it """
+
+    def __init__(self, data: np.ndarray):
+        self.data = data
+
+    @staticmethod
+    def from_lines(lines: Iterable[str]) -> 'Grid':
+        rows = [line.encode() for line in lines if line]
+        if not rows:
+            return Grid(np.empty((0, 0), dtype=np.uint8))
+        if len(set(map(len, rows))) > 1:
+            raise ValueError('rows of the grid differ in length')
+        data = np.frombuffer(b''.join(rows), dtype=np.uint8).reshape(len(rows), -1)
+        return Grid(data.copy())
+
+    @staticmethod
+    def from_file(path: str) -> 'Grid':
+        return Grid.from_lines(loader.iter_lines(path))
+
+    @property
+    def height(self) -> int:
+        return self.data.shape[0]
+
+    @property
+    def width(self) -> int:
+        return self.data.shape[1]
+
+    def get(self, row: int, col: int) -> Optional[str]:
+        if 0 <= row < self.height and 0 <= col < self.width:
+            return chr(self.data[row, col])
+        return None
+
+    def get_wrapped(self, row: int, col: int) -> str:
+        return chr(self.data[row % self.height, col % self.width])
+
+    def take_wrapped(self, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        return self.data[rows % self.height, cols % self.width]
+
+    def set(self, row: int, col: int, char: str):
+        self.data[row, col] = ord(char)
+
+    def mask(self, chars: str) -> np.ndarray:
+        if len(chars) == 1:
+            return self.data == ord(chars)
+        return np.isin(self.data, np.frombuffer(chars.encode(), dtype=np.uint8))
+
+    def count(self, chars: str) -> int:
+        return int(np.count_nonzero(self.mask(chars)))
+
+    def rotate(self, times: int = 1) -> 'Grid':
+        """ Counterclockwise rotation by 90 degrees the given number of times """
+        return Grid(np.rot90(self.data, times))
+
+    def flip(self) -> 'Grid':
+        return Grid(np.fliplr(self.data))
+
+    def iter_variants(self) -> Iterator['Grid']:
+        for grid in (self, self.flip()):
+            for times in range(4):
+                yield grid.rotate(times)
+
+    def copy(self) -> 'Grid':
+        return Grid(self.data.copy())
+
+    def to_lines(self) -> List[str]:
+        return [row.tobytes().decode() for row in self.data]
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Grid) and np.array_equal(self.data, other.data)
+
+    def __str__(self) -> str:
+        return '\n'.join(self.to_lines())
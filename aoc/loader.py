@@ -0,0 +1,74 @@
+import contextlib
+import mmap
+import os
+from typing import IO, AnyStr, Iterable, Iterator, List, Optional, Tuple, Union
+
+TBuffer = Union[mmap.mmap, bytes]
+
+
+@contextlib.contextmanager
+def open_mapped(path: str) -> Iterator[TBuffer]:
+    with open(path, 'rb') as fp:
+        if not os.fstat(fp.fileno()).st_size:
+            # an empty file can not be mapped
+            yield b''
+            return
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
+
+
+def _iter_raw_lines(data: TBuffer) -> Iterator[bytes]:
+    if isinstance(data, bytes):
+        yield from data.splitlines()
+        return
+    for line in iter(data.readline, b''):
+        yield line.rstrip(b'\r\n')
+
+
+def iter_byte_lines(path: str) -> Iterator[bytes]:
+    with open_mapped(path) as data:
+        yield from _iter_raw_lines(data)
+
+
+def iter_lines(path: str) -> Iterator[str]:
+    for line in iter_byte_lines(path):
+        yield line.decode()
+
+
+def iter_stream_lines(stream: IO[str]) -> Iterator[str]:
+    for line in stream:
+        yield line.rstrip('\r\n')
+
+
+def group_blocks(lines: Iterable[AnyStr]) -> Iterator[List[AnyStr]]:
+    block = []
+    for line in lines:
+        if line:
+            block.append(line)
+        elif block:
+            yield block
+            block = []
+    if block:
+        yield block
+
+
+def iter_blocks(path: str) -> Iterator[List[str]]:
+    return group_blocks(iter_lines(path))
+
+
+def iter_ints(path: str) -> Iterator[int]:
+    for line in iter_byte_lines(path):
+        if line:
+            yield int(line)
+
+
+def iter_int_columns(path: str, sep: Optional[bytes] = None) -> Iterator[Tuple[int, ...]]:
+    for line in iter_byte_lines(path):
+        if line:
+            yield tuple(int(value) for value in line.split(sep))
+
+
+def iter_cells(path: str) -> Iterator[Tuple[int, int, str]]:
+    for row, line in enumerate(iter_lines(path)):
+        for col, char in enumerate(line):
+            yield row, col, char
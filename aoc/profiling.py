@@ -0,0 +1,149 @@
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from types import FrameType
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+from aoc.tasks import ROOT_DIR, JobInfo, run_job
+
+DEFAULT_DIR = os.path.join(ROOT_DIR, '.profiles')
+
+_SAMPLING_INTERVAL = 0.001
+_SNAPSHOT_INTERVAL = 0.01
+_SNAPSHOT_GROWTH = 1.1
+
+
+def _get_file_prefix(job: JobInfo) -> str:
+    input_name = os.path.splitext(job.input_name)[0]
+    return f'{job.task.year}_task_{job.task.day:02}_part{job.part}_{input_name}'
+
+
+def _describe_frame(frame: FrameType) -> str:
+    code = frame.f_code
+    return f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})'
+
+
+def _collapse_stack(frame: FrameType) -> str:
+    names = []
+    # frames of the runner above the job are the same for every sample
+    while frame is not None and frame.f_code is not run_job.__code__:
+        names.append(_describe_frame(frame))
+        frame = frame.f_back
+    return ';'.join(reversed(names))
+
+
+class _StackSampler(threading.Thread):
+    """ Periodically records the stack of the observed thread """
+
+    def __init__(self, thread_id: int, interval: float):
+        super().__init__(daemon=True)
+        self.stacks = Counter()  # type: Dict[str, int]
+        self._thread_id = thread_id
+        self._interval = interval
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            frame = sys._current_frames().get(self._thread_id)
+            stack = _collapse_stack(frame) if frame is not None else None
+            if stack:
+                self.stacks[stack] += 1
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
+
+
+class _PeakSnapshotter(threading.Thread):
+    """ Keeps the tracemalloc snapshot taken closest to the peak of traced memory """
+
+    def __init__(self, interval: float):
+        super().__init__(daemon=True)
+        self.snapshot = None  # type: Optional[tracemalloc.Snapshot]
+        self._size = 0
+        self._interval = interval
+        self._stopped = threading.Event()
+
+    def update(self) -> None:
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self._size * _SNAPSHOT_GROWTH:
+            self.snapshot = tracemalloc.take_snapshot()
+            self._size = current
+
+    def run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            self.update()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
+        self.update()
+
+
+def _profile_cpu(job: JobInfo, prefix: str, top: int) -> Tuple[Any, str]:
+    profiler = cProfile.Profile()
+    sampler = _StackSampler(threading.get_ident(), _SAMPLING_INTERVAL)
+    sampler.start()
+    try:
+        answer = profiler.runcall(run_job, job)
+    finally:
+        sampler.stop()
+
+    profiler.dump_stats(f'{prefix}.pstats')
+    with open(f'{prefix}.collapsed', 'w') as fp:
+        for stack, count in sorted(sampler.stacks.items()):
+            fp.write(f'{stack} {count}\n')
+
+    report = io.StringIO()
+    stats = pstats.Stats(profiler, stream=report)
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(top)
+    return answer, report.getvalue()
+
+
+def _profile_memory(job: JobInfo, prefix: str, top: int) -> Tuple[Any, str]:
+    tracemalloc.start(25)
+    snapshotter = _PeakSnapshotter(_SNAPSHOT_INTERVAL)
+    snapshotter.start()
+    try:
+        answer = run_job(job)
+    finally:
+        snapshotter.stop()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    snapshot = snapshotter.snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap*>'),
+    ))
+    snapshot.dump(f'{prefix}.tracemalloc')
+
+    report = io.StringIO()
+    print(f'peak traced memory {peak / 1024:.1f} KiB, top {top} allocation sites near the peak:', file=report)
+    for stat in snapshot.statistics('lineno')[:top]:
+        print(f'  {stat.size / 1024:10.1f} KiB {stat.count:10} blocks  {stat.traceback}', file=report)
+    with open(f'{prefix}.allocations.txt', 'w') as fp:
+        fp.write(report.getvalue())
+    return answer, report.getvalue()
+
+
+PROFILERS = {
+    'cpu': _profile_cpu,
+    'memory': _profile_memory,
+}  # type: Dict[str, Callable[[JobInfo, str, int], Tuple[Any, str]]]
+
+
+class ProfileSettings(NamedTuple):
+    mode: str
+    output_dir: str = DEFAULT_DIR
+    top: int = 20
+
+
+def profile_job(job: JobInfo, settings: ProfileSettings) -> Tuple[Any, str]:
+    os.makedirs(settings.output_dir, exist_ok=True)
+    prefix = os.path.join(settings.output_dir, _get_file_prefix(job))
+    return PROFILERS[settings.mode](job, prefix, settings.top)
@@ -0,0 +1,158 @@
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, List, NamedTuple, Optional, Sequence
+
+from aoc import answers, cache as answer_cache, profiling
+from aoc.cache import AnswerCache, CachedAnswer
+from aoc.profiling import ProfileSettings, profile_job
+from aoc.tasks import JobInfo, discover_tasks, get_jobs, run_job, select_tasks
+
+
+class JobResult(NamedTuple):
+    job: JobInfo
+    answer: Any
+    elapsed: float
+    error: Optional[str]
+    is_cached: bool = False
+    report: Optional[str] = None
+
+
+def execute_job(job: JobInfo, cache: Optional[AnswerCache] = None,
+                profile: Optional[ProfileSettings] = None) -> JobResult:
+    key = cache.get_key(job) if cache else None
+    cached = cache.get(key) if cache else None
+    if cached:
+        return JobResult(job=job, answer=cached.answer, elapsed=cached.elapsed, error=None, is_cached=True)
+
+    report = None
+    started = time.perf_counter()
+    try:
+        if profile:
+            answer, report = profile_job(job, profile)
+        else:
+            answer = run_job(job)
+        error = None
+    except Exception as exc:
+        answer = None
+        error = f'{type(exc).__name__}: {exc}'
+    elapsed = time.perf_counter() - started
+
+    if cache and not error:
+        cache.put(key, CachedAnswer(answer=answer, elapsed=elapsed))
+    return JobResult(job=job, answer=answer, elapsed=elapsed, error=error, report=report)
+
+
+def run_jobs(jobs: Sequence[JobInfo], workers: int, cache: Optional[AnswerCache] = None,
+             profile: Optional[ProfileSettings] = None) -> List[JobResult]:
+    results = [None] * len(jobs)  # type: List[Optional[JobResult]]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(execute_job, job, cache, profile): index for index, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            result = future.result()
+            status = 'failed' if result.error else 'cached' if result.is_cached else 'done'
+            print(f'{status:>6} {result.elapsed:9.3f}s  {result.job.name}', flush=True)
+            if result.report:
+                print(result.report, flush=True)
+            results[futures[future]] = result
+    return results
+
+
+def print_table(rows: Sequence[Sequence[str]]) -> None:
+    widths = [max(len(row[col]) for row in rows) for col in range(len(rows[0]))]
+    print()
+    for row_no, row in enumerate(rows):
+        print('  '.join(value.ljust(width) for value, width in zip(row, widths)).rstrip())
+        if row_no == 0:
+            print('  '.join('-' * width for width in widths))
+
+
+def print_summary(results: Sequence[JobResult], total: float) -> None:
+    rows = [('task', 'part', 'input', 'time, s', 'answer')]
+    for result in results:
+        answer = f'ERROR {result.error}' if result.error else str(result.answer)
+        elapsed = f'{result.elapsed:.3f}' + (' (cached)' if result.is_cached else '')
+        rows.append((result.job.task.name, str(result.job.part), result.job.input_name, elapsed, answer))
+    print_table(rows)
+
+    computed = [result for result in results if not result.is_cached]
+    busy = sum(result.elapsed for result in computed)
+    longest = max((result.elapsed for result in computed), default=0.0)
+    print()
+    print(f'jobs {len(results)}, cached {len(results) - len(computed)}, failed {sum(1 for x in results if x.error)}')
+    print(f'wall time {total:.3f}s, busy time {busy:.3f}s, longest job {longest:.3f}s')
+
+
+def print_verifications(verifications: Sequence[answers.Verification]) -> None:
+    print()
+    for verification in verifications:
+        if verification.status == answers.STATUS_OK:
+            continue
+        if verification.status == answers.STATUS_ERROR:
+            details = verification.error
+        elif verification.status == answers.STATUS_MISSING:
+            details = f'no expected answer, actual {verification.actual!r}'
+        else:
+            details = f'expected {verification.expected!r}, actual {verification.actual!r}'
+        print(f'{verification.status.upper():>7}  {verification.job.name}: {details}')
+    counts = answers.count_by_status(verifications)
+    print(f'verified {len(verifications)} jobs: ' + ', '.join(f'{status} {count}' for status, count in counts.items()))
+
+
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m aoc.runner', description='Run puzzle solvers in parallel.')
+    parser.add_argument('patterns', nargs='*', help='tasks to run, e.g. 2020 or 2020/task_1* (default: all)')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(), help='count of worker processes')
+    parser.add_argument('--no-cache', action='store_true', help='bypass the answer cache and solve everything')
+    parser.add_argument('--cache-dir', default=answer_cache.DEFAULT_DIR, help='directory of the answer cache')
+    parser.add_argument('--cache-size', type=int, default=answer_cache.DEFAULT_MAX_BYTES,
+                        help='answer cache limit in bytes')
+    parser.add_argument('--profile', choices=sorted(profiling.PROFILERS),
+                        help='run jobs under cProfile and a stack sampler (cpu) or tracemalloc (memory)')
+    parser.add_argument('--profile-dir', default=profiling.DEFAULT_DIR, help='directory for profiling results')
+    parser.add_argument('--top', type=int, default=20, help='count of hot functions or allocation sites to print')
+    parser.add_argument('--verify', action='store_true',
+                        help='solve everything without the cache and check the answers against the registry')
+    parser.add_argument('--report', help='JSON file for the verification report, implies --verify')
+    parser.add_argument('--record', action='store_true', help='store the answers of the run in the registry')
+    parser.add_argument('--answers', default=answers.DEFAULT_PATH, help='JSON registry of the expected answers')
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(argv)
+    tasks = select_tasks(discover_tasks(), args.patterns)
+    jobs = get_jobs(tasks)
+    print('found', len(tasks), 'tasks,', len(jobs), 'jobs, workers', args.jobs)
+
+    # profiling and verification need the solvers to run, so they never take answers from the cache
+    is_verified = args.verify or bool(args.report)
+    is_cached = not (args.no_cache or args.profile or is_verified)
+    cache = AnswerCache(args.cache_dir, args.cache_size) if is_cached else None
+    profile = ProfileSettings(args.profile, args.profile_dir, args.top) if args.profile else None
+    started = time.perf_counter()
+    results = run_jobs(jobs, args.jobs, cache, profile)
+    print_summary(results, time.perf_counter() - started)
+
+    if args.record:
+        answers.save_answers(args.answers, {result.job.name: result.answer for result in results if not result.error})
+        print('\nanswers saved to', args.answers)
+
+    if not is_verified:
+        return int(any(result.error for result in results))
+
+    expected = answers.load_answers(args.answers)
+    verifications = [
+        answers.verify(result.job, expected, result.answer, result.elapsed, result.error) for result in results
+    ]
+    print_verifications(verifications)
+    if args.report:
+        answers.save_report(args.report, verifications)
+        print('report saved to', args.report)
+    return int(bool(answers.get_failures(verifications)))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
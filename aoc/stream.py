@@ -0,0 +1,38 @@
+import argparse
+import contextlib
+import sys
+from typing import Optional, Sequence
+
+from aoc import loader
+from aoc.tasks import PARTS, discover_tasks, get_stream_solver, select_tasks
+
+
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m aoc.stream',
+                                     description='Solve both parts in one pass over the input from stdin.')
+    parser.add_argument('task', help='task to solve, e.g. 2021/task_01')
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(argv)
+    tasks = select_tasks(discover_tasks(), [args.task])
+    if len(tasks) != 1:
+        print(f'{args.task} matches {len(tasks)} tasks, expected exactly one', file=sys.stderr)
+        return 2
+
+    task = tasks[0]
+    solver = get_stream_solver(task)
+    if solver is None:
+        print(f'{task.name} has no streaming solver', file=sys.stderr)
+        return 2
+
+    with contextlib.redirect_stdout(sys.stderr):
+        answers = solver(loader.iter_stream_lines(sys.stdin))
+    for part, answer in zip(PARTS, answers):
+        print(f'part{part}', answer)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,116 @@
+import contextlib
+import fnmatch
+import glob
+import importlib
+import os
+import re
+from types import ModuleType
+from typing import Any, Callable, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PARTS = (1, 2)
+
+_RE_TASK_DIR = re.compile(r'(?P<year>\d{4})/task_(?P<day>\d{2})')
+_DEFAULT_INPUTS = ('test*.txt', 'puzzle*.txt')
+
+
+class TaskInfo(NamedTuple):
+    year: int
+    day: int
+    module_name: str
+    directory: str
+
+    @property
+    def name(self) -> str:
+        return f'{self.year}/task_{self.day:02}'
+
+
+class JobInfo(NamedTuple):
+    task: TaskInfo
+    part: int
+    path: str
+
+    @property
+    def input_name(self) -> str:
+        return os.path.basename(self.path)
+
+    @property
+    def name(self) -> str:
+        return f'{self.task.name} part{self.part} {self.input_name}'
+
+
+def _build_task(path: str) -> Optional[TaskInfo]:
+    relative = os.path.relpath(path, ROOT_DIR).replace(os.sep, '/')
+    match = _RE_TASK_DIR.match(relative)
+    if not match:
+        return None
+    module_name = os.path.splitext(relative)[0].replace('/', '.')
+    return TaskInfo(
+        year=int(match.group('year')),
+        day=int(match.group('day')),
+        module_name=module_name,
+        directory=os.path.dirname(path)
+    )
+
+
+def discover_tasks() -> List[TaskInfo]:
+    tasks = []
+    for path in sorted(glob.glob(os.path.join(ROOT_DIR, '[0-9]' * 4, 'task_*', '*.py'))):
+        task = _build_task(path)
+        if task:
+            tasks.append(task)
+    return tasks
+
+
+def _is_selected(task: TaskInfo, pattern: str) -> bool:
+    pattern = pattern.rstrip('/')
+    return fnmatch.fnmatch(task.name, pattern) or task.name.startswith(pattern + '/')
+
+
+def select_tasks(tasks: Iterable[TaskInfo], patterns: Sequence[str]) -> List[TaskInfo]:
+    if not patterns:
+        return list(tasks)
+    return [task for task in tasks if any(_is_selected(task, pattern) for pattern in patterns)]
+
+
+def load_module(task: TaskInfo) -> ModuleType:
+    return importlib.import_module(task.module_name)
+
+
+def get_solver(task: TaskInfo, part: int) -> Optional[Callable[[str], Any]]:
+    return getattr(load_module(task), f'solve_part{part}', None)
+
+
+def get_stream_solver(task: TaskInfo) -> Optional[Callable[[Iterable[str]], Tuple[Any, Any]]]:
+    return getattr(load_module(task), 'solve_stream', None)
+
+
+def get_inputs(task: TaskInfo, part: int) -> List[str]:
+    inputs_by_part = getattr(load_module(task), 'INPUTS_by_PART', {})
+    if part in inputs_by_part:
+        return [os.path.join(task.directory, name) for name in inputs_by_part[part]]
+
+    paths = []
+    for pattern in _DEFAULT_INPUTS:
+        paths.extend(sorted(glob.glob(os.path.join(task.directory, pattern))))
+    return paths
+
+
+def get_jobs(tasks: Iterable[TaskInfo]) -> List[JobInfo]:
+    jobs = []
+    for task in tasks:
+        for part in PARTS:
+            if get_solver(task, part) is None:
+                continue
+            for path in get_inputs(task, part):
+                jobs.append(JobInfo(task=task, part=part, path=path))
+    return jobs
+
+
+def run_job(job: JobInfo, quiet: bool = True) -> Any:
+    solver = get_solver(job.task, job.part)
+    if not quiet:
+        return solver(job.path)
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        return solver(job.path)